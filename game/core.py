@@ -42,6 +42,9 @@ class Goban:
         # History of board states (used for ko rule)
         self.states: List[np.ndarray] = [self.board.copy()]
 
+        # Stones removed by the last move played
+        self.last_captured: List[Tuple[int, int]] = []
+
     # ======================
     # Basic utilities
     # ======================
@@ -214,13 +217,15 @@ class Goban:
         opponent: int = self.opponent(color)
 
         # Remove captured opponent chains
-        capture = False
+        captured: List[Tuple[int, int]] = []
         for nx, ny in self._neighbours(x, y):
             if self.board[nx, ny] == opponent:
                 chain, liberties = self._chain_and_liberties(nx, ny)
                 if not liberties:
                     self._remove_chain(chain)
-                    capture = True
+                    captured.extend(chain)
+        self.last_captured = captured
+        capture = bool(captured)
 
         # Save new board state (for ko)
         self.states.append(self.board.copy())
@@ -356,6 +361,9 @@ class GoGame:
         self.white_passed: bool = False
         self.nbr_moves: int = 0
 
+        # Stones removed by the last move taken
+        self.last_captured: List[Tuple[int, int]] = []
+
         self.singleplayer: bool = False
 
     def copy(self) -> "GoGame":
@@ -373,6 +381,7 @@ class GoGame:
         new_game.black_passed = self.black_passed
         new_game.white_passed = self.white_passed
         new_game.nbr_moves = self.nbr_moves
+        new_game.last_captured = list(self.last_captured)
 
         return new_game
 
@@ -406,6 +415,7 @@ class GoGame:
         """
         successfull, capture = self.goban.play_move(x, y, self.current_color)
         if successfull:
+            self.last_captured = self.goban.last_captured
             self.nbr_moves += 1
             self.black_passed = False
             self.white_passed = False
@@ -13,11 +13,15 @@ import sys
 from pathlib import Path
 from PIL import Image, ImageTk
 import os
+import importlib.util
+import ssl
+from typing import Hashable
 
 import httpx
 import requests
 import asyncio
 import threading
+from concurrent.futures import Future
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -84,6 +88,19 @@ class App(tk.Tk):
         # Initialize sound manager
         self.sound_manager = SoundManager()
 
+        # Persistent event loop running the network coroutines, and the HTTP
+        # client shared by all of them (its connection pool is bound to the loop)
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self.http = httpx.AsyncClient(
+            # HTTP/2 multiplexes back-to-back calls on one connection, it needs h2
+            http2=importlib.util.find_spec("h2") is not None,
+            # Verifying TLS context, built once for the whole client
+            verify=ssl.create_default_context(),
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
         # Store and apply preferences
         self.username = None
         self.password = None
@@ -104,6 +121,9 @@ class App(tk.Tk):
 
         self.current_frame = None
 
+        # Frames kept alive between visits, by the key given to show_frame
+        self._frames: dict[Hashable, tk.Widget] = {}
+
         # Apply full screen window
         self.attributes("-fullscreen", True)
         self.update_idletasks()
@@ -780,6 +800,28 @@ class App(tk.Tk):
             bordercolor=[("focus", "white"), ("!focus", "black")],
         )
 
+        # Configure combobox style
+        style.configure(
+            "TCombobox",
+            background="#1e1e1e",
+            foreground="white",
+            fieldbackground="#1e1e1e",
+            arrowcolor="white",
+            borderwidth=2,
+            bordercolor="black",
+            padding=2,
+        )
+        style.map(
+            "TCombobox",
+            fieldbackground=[("readonly", "#1e1e1e")],
+            foreground=[("readonly", "white")],
+            selectbackground=[("readonly", "#1e1e1e")],
+            selectforeground=[("readonly", "white")],
+        )
+
+        # Configure lobby radiobutton style
+        style.configure("Lobby.TRadiobutton", font=("Skranji", 14))
+
         # Configure error entry style
         style.configure(
             "Error.TEntry",
@@ -927,19 +969,39 @@ class App(tk.Tk):
             **kwargs,
         )
 
-    def show_frame(self, frame_class) -> None:
+    def show_frame(self, frame_class, key: Hashable | None = None) -> None:
         """
         Switch to a different frame.
 
+        Frames shown with a key are hidden instead of destroyed when leaving them,
+        and shown again (after calling their reset method, if any) the next time
+        the same key is requested. They live as long as the application, so their
+        reset method must clear any state tied to the connected user.
+
         Args:
             frame_class: The frame class to display.
+            key (Hashable, optional): Key under which the frame is kept alive.
+                Defaults to None.
         """
 
         if self.current_frame is not None:
-            self.current_frame.destroy()
+            if any(frame is self.current_frame for frame in self._frames.values()):
+                self.current_frame.grid_remove()
+            else:
+                self.current_frame.destroy()
 
-        self.current_frame = frame_class(self.container, self)
+        frame = self._frames.get(key) if key is not None else None
+        if frame is not None and frame.winfo_exists():
+            if hasattr(frame, "reset"):
+                frame.reset()  # type: ignore
+        else:
+            frame = frame_class(self.container, self)
+            if key is not None:
+                self._frames[key] = frame
+
+        self.current_frame = frame
         self.current_frame.grid(row=0, column=0, sticky="nsew")
+        self.current_frame.tkraise()
 
         # Ensure account panel stays on top if it exists
         if hasattr(self, "account_panel") and self.account_panel:
@@ -1023,33 +1085,43 @@ class App(tk.Tk):
         """
 
         try:
-            async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-                response = await client.get(
-                    f"{BASE_URL}/auth/verify",
-                    params={"token": token},
-                )
+            response = await self.http.get(
+                f"{BASE_URL}/auth/verify",
+                params={"token": token},
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    # Update in main thread
-                    self.after(0, self._on_token_verified, data, token)
-                else:
-                    # Invalid token, clear it
-                    self.after(0, self._on_token_invalid)
+            if response.status_code == 200:
+                data = response.json()
+                # Update in main thread
+                self.after(0, self._on_token_verified, data, token)
+            else:
+                # Invalid token, clear it
+                self.after(0, self._on_token_invalid)
 
         except Exception as e:
             # Network error or invalid token
             self.after(0, self._on_token_invalid)
 
+    def run_async(self, coro) -> Future:
+        """
+        Schedule a coroutine on the persistent network event loop.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            Future: The future holding the result of the coroutine.
+        """
+
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
     def _start_token_verification(self) -> None:
-        """Start token verification in a background thread."""
+        """Start token verification on the network event loop."""
         token = self.preferences.get("auth_token")
         if token:
             self._autoconnect_loading = self.show_loading("Connexion automatique...")
-            thread = threading.Thread(
-                target=lambda: asyncio.run(self._verify_token(token))
-            )
-            thread.start()
+            self.run_async(self._verify_token(token))
 
     def _on_token_verified(self, data: dict, token: str) -> None:
         """Called in main thread when token is verified."""
@@ -1325,13 +1397,6 @@ class App(tk.Tk):
             if username
             else None
         )
-        print(username_photo_path)
-        print(
-            username_photo_path.exists()
-            if username_photo_path
-            else "No username photo path"
-        )
-
         if username_photo_path and username_photo_path.exists():
             return ImageTk.PhotoImage(
                 Image.open(username_photo_path).resize(
@@ -1413,8 +1478,8 @@ class App(tk.Tk):
                     except Exception as e:
                         return False
 
-                # Run async function in thread
-                result = asyncio.run(test_ws_health())
+                # Run async function on the persistent network event loop
+                result = self.run_async(test_ws_health()).result(timeout=15)
                 elapsed_time = time.time() - start_time
 
                 if result:
@@ -1480,6 +1545,13 @@ class App(tk.Tk):
                 except Exception as e:
                     pass
 
+            # Close the shared HTTP client and stop the network loop
+            try:
+                self.run_async(self.http.aclose()).result(timeout=2)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
             save_dictionnary(self.preferences, "preferences.prefs")
             if self.current_game is not None:
                 save_game(self.current_game, "saves/autosave.csgogame")
@@ -4,6 +4,7 @@ Login / register dialog for user authentication.
 This module provides the dialog interface for users to log in or register.
 """
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 from io import BytesIO
@@ -11,19 +12,105 @@ import tkinter as tk
 import tkinter.ttk as ttk
 import tkinter.filedialog as filedialog
 
+import secrets
 import requests
-import asyncio
-import httpx
-import threading
+from requests.adapters import HTTPAdapter
 from PIL import Image, ImageTk
 
 if TYPE_CHECKING:
     from gui.app import App
-from gui.widgets import TopLevelWindow, TexturedButton, clear_image_cache
+from gui.widgets import (
+    TopLevelWindow,
+    TexturedButton,
+    bind_mousewheel_scroll,
+    clear_image_cache,
+)
 
 # API base URL
 from config import BASE_URL, BASE_FOLDER_PATH
 
+_PROFILES_DIR = Path(BASE_FOLDER_PATH) / "gui" / "images" / "profiles"
+
+# Keep-alive session shared by the synchronous requests of this module
+_SESSION: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the keep-alive requests session, creating it on first use.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+# Resized default profile pictures, keyed by target size
+_DEFAULT_CACHE: dict[tuple[int, int], Path] = {}
+
+
+def _fit_picture(image: Image.Image, target_size: tuple[int, int]) -> Image.Image:
+    """
+    Center crop an image to the target aspect ratio and downscale it.
+
+    Args:
+        image (Image.Image): The image to fit.
+        target_size (tuple[int, int]): The wanted size of the image.
+
+    Returns:
+        Image.Image: The fitted image.
+    """
+
+    ratio = target_size[0] / target_size[1]
+    width = min(image.width, int(image.height * ratio))
+    height = min(image.height, int(image.width / ratio))
+    left = (image.width - width) // 2
+    top = (image.height - height) // 2
+    image = image.crop((left, top, left + width, top + height))
+
+    # reducing_gap lets Pillow box-reduce large sources before the LANCZOS pass
+    return image.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+def _get_default_profile_path(target_size: tuple[int, int]) -> Path:
+    """
+    Get the path of the default profile picture resized to target_size.
+
+    The resized picture is generated once on disk and reused afterwards.
+
+    Args:
+        target_size (tuple[int, int]): The wanted size of the picture.
+
+    Returns:
+        Path: The path of the resized default profile picture.
+    """
+
+    cached = _DEFAULT_CACHE.get(target_size)
+    if cached is not None:
+        return cached
+
+    default_profile_path = _PROFILES_DIR / "default_profile_photo.png"
+    resized_path = (
+        _PROFILES_DIR / f"default_profile_photo_{target_size[0]}x{target_size[1]}.webp"
+    )
+    try:
+        if not resized_path.exists():
+            image = Image.open(default_profile_path).convert("RGBA")
+            image = _fit_picture(image, target_size)
+            image.save(resized_path, format="WEBP")
+    except Exception:
+        resized_path = default_profile_path
+
+    _DEFAULT_CACHE[target_size] = resized_path
+    return resized_path
+
 
 class AccountFrame(ttk.Frame):
     """
@@ -65,16 +152,6 @@ class AccountFrame(ttk.Frame):
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except tk.TclError:
-                # Canvas has been destroyed, binding will be cleaned up
-                pass
-
-        self._mousewheel_binding = self.bind_all("<MouseWheel>", _on_mousewheel)
-
         # Account information
         title = ttk.Label(
             scrollable_frame, text="Informations du compte", style="SubTitle.TLabel"
@@ -138,6 +215,10 @@ class AccountFrame(ttk.Frame):
         )
         self.password_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
 
+        # Values the entries are compared against to enable the save button
+        self._baseline = (self.app.name, self.app.password or "")
+        self._last_changed: bool | None = None
+
         # Edit account button
         self.edit_account_button = self.app.Button(
             account_frame,
@@ -158,8 +239,8 @@ class AccountFrame(ttk.Frame):
                 tk.DISABLED
                 if (
                     self.app.password
-                    and self.app.name == self.name_var.get()
-                    and self.app.password == self.password_var.get()
+                    and (self.name_var.get(), self.password_var.get())
+                    == self._baseline
                 )
                 else tk.NORMAL
             ),
@@ -177,36 +258,56 @@ class AccountFrame(ttk.Frame):
         )
         self.return_button.pack(pady=(0, 20), padx=20, anchor=tk.S)
 
-        # Bind Enter key to login
-        self.bind("<Return>", lambda event: self._login())
-        self.name_entry.bind("<Return>", lambda event: self._login())
-        self.password_entry.bind("<Return>", lambda event: self._login())
-
         # Bind Tab key to navigate between entries
-        self.name_entry.bind(
-            "<Tab>", lambda e: (self.password_entry.focus_set(), "break")[1]
-        )
-        self.password_entry.bind(
-            "<Tab>", lambda e: (self.name_entry.focus_set(), "break")[1]
-        )
+        self.name_entry.bind("<Tab>", self._focus_password)
+        self.password_entry.bind("<Tab>", self._focus_name)
 
         self.app.hide_loading(loading)
 
         self.name_entry.bind("<KeyRelease>", self._update_button)
         self.password_entry.bind("<KeyRelease>", self._update_button)
 
+        # Enable mouse wheel scrolling
+        bind_mousewheel_scroll(self, canvas)
+
+    def _focus_password(self, event: tk.Event) -> str:
+        """
+        Move the focus to the password entry on Tab.
+
+        Args:
+            event (tk.Event): The key event.
+
+        Returns:
+            str: "break" to stop the default focus traversal.
+        """
+
+        self.password_entry.focus_set()
+        return "break"
+
+    def _focus_name(self, event: tk.Event) -> str:
+        """
+        Move the focus to the name entry on Tab.
+
+        Args:
+            event (tk.Event): The key event.
+
+        Returns:
+            str: "break" to stop the default focus traversal.
+        """
+
+        self.name_entry.focus_set()
+        return "break"
+
     def _update_button(self, e):
         """
         Update state of self.edit_account_button when we change the name or the password of the user.
         """
 
-        if (
-            self.name_var.get() != self.app.name
-            or self.password_var.get() != self.app.password
-        ):
-            self.edit_account_button.config(state=tk.NORMAL)
-        else:
-            self.edit_account_button.config(state=tk.DISABLED)
+        changed = (self.name_var.get(), self.password_var.get()) != self._baseline
+        if changed == self._last_changed:
+            return
+        self._last_changed = changed
+        self.edit_account_button.config(state=tk.NORMAL if changed else tk.DISABLED)
 
     def _on_edit_account(self):
         """
@@ -218,6 +319,7 @@ class AccountFrame(ttk.Frame):
         if self.app.password:
             self.name_entry.config(state=tk.NORMAL)
             self.password_entry.config(state=tk.NORMAL)
+            self._last_changed = False
             self.edit_account_button.configure(
                 state=tk.DISABLED,
                 text="Sauvegarder",
@@ -233,42 +335,23 @@ class AccountFrame(ttk.Frame):
         Download the user's profile picture from the backend API and save it locally.
         """
 
-        self.profile_picture_path = (
-            Path(BASE_FOLDER_PATH)
-            / "gui"
-            / "images"
-            / "profiles"
-            / "current_profile_picture.webp"
-        )
-        default_profile_path = (
-            Path(BASE_FOLDER_PATH)
-            / "gui"
-            / "images"
-            / "profiles"
-            / "default_profile_photo.png"
-        )
+        self.profile_picture_path = _PROFILES_DIR / "current_profile_picture.webp"
         target_size = (236, 236)
 
         try:
-            response = requests.get(
+            response = _get_session().get(
                 f"{BASE_URL}/users/{self.app.username}/profile-picture",
                 timeout=5,
             )
             if response.status_code == 200:
                 image = Image.open(BytesIO(response.content)).convert("RGBA")
+                image = _fit_picture(image, target_size)
+                image.save(self.profile_picture_path, format="WEBP")
             else:
-                image = Image.open(default_profile_path).convert("RGBA")
-
-            image = image.resize(target_size, Image.Resampling.LANCZOS)
-            image.save(self.profile_picture_path, format="WEBP")
+                self.profile_picture_path = _get_default_profile_path(target_size)
 
         except Exception:
-            try:
-                image = Image.open(default_profile_path).convert("RGBA")
-                image = image.resize(target_size, Image.Resampling.LANCZOS)
-                image.save(self.profile_picture_path, format="WEBP")
-            except Exception:
-                self.profile_picture_path = default_profile_path
+            self.profile_picture_path = _get_default_profile_path(target_size)
 
     def _on_change_profile_picture(self) -> None:
         """
@@ -307,131 +390,6 @@ class AccountFrame(ttk.Frame):
         self.change_profile_picture_button.configure(texture_path=picture_path)
         self.app.notify_profile_photo_updated()
 
-    def _login(self) -> None:
-        """
-        Handle user login action.
-        """
-
-        username = self.username_var.get()
-        password = self.password_var.get()
-
-        # Check if all fields are filled
-        if username == "" or password == "":
-            if username == "":
-                self.username_entry.configure(highlightbackground="red")
-            if password == "":
-                self.password_entry.configure(highlightbackground="red")
-            self._show_error("Veuillez remplir tous les champs.")
-            return
-        self.username_entry.configure(highlightcolor="black")
-        self.password_entry.configure(highlightcolor="black")
-
-        self.login_button.config(state=tk.DISABLED)
-
-        thread = threading.Thread(
-            target=lambda: asyncio.run(self._do_login(username, password))
-        )
-        thread.start()
-
-    async def _do_login(self, username: str, password: str) -> None:
-        """
-        Authenticate a user with the backend API using async httpx.
-
-        Args:
-            username (str): The username of the user.
-            password (str): The password of the user.
-        """
-
-        self.app.show_loading("Connexion en cours...")
-
-        try:
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.post(
-                    f"{BASE_URL}/auth/login",
-                    params={"username": username, "password": password},
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    self.app.after(0, self._on_login_success, data)
-                else:
-                    self.app.after(0, self._on_login_error, "Identifiants incorrects")
-
-        except Exception as e:
-            self.app.after(0, self._on_login_error, str(e))
-
-    def _on_login_success(self, data: dict) -> None:
-        """Appelé dans le thread principal après succès."""
-        self.app.token = data["token"]
-        self.app.username = data["username"]
-
-        # Fetch full user data to get the name
-        self.app._fetch_user_data()
-
-        # Mark user as connected in database
-        self.app._mark_user_connected()
-
-        # Notify that username and profile photo have been updated
-        self.app.notify_username_updated()
-        self.app.notify_profile_photo_updated()
-
-        # Import here to avoid circular dependency at module load time
-        from gui.frames import LobbyFrame
-
-        # Close dialog and show lobby
-        self.app.hide_loading()
-        dialog = self.winfo_toplevel()
-        if isinstance(dialog, TopLevelWindow):
-            dialog.close()
-
-        self.app.preferences["auth_token"] = self.app.token
-        self.app.show_frame_with_loading(LobbyFrame, "Chargement du lobby...")
-
-    def _on_login_error(self, error: str) -> None:
-        """
-        Appelé dans le thread principal après erreur.
-        """
-        self.app.hide_loading()
-        self.login_button.config(state=tk.NORMAL)
-        self.username_entry.configure(highlightbackground="red")
-        self.password_entry.configure(highlightbackground="red")
-        self._show_error(error)
-
-        # Re-raise dialog above parent after messagebox closes
-        dialog = self.winfo_toplevel()
-        if isinstance(dialog, tk.Toplevel):
-            dialog.lift()
-            dialog.focus_set()
-
-        # Reset entries and button for retry
-        self.password_var.set("")
-        self.username_var.set("")
-        self.login_button.config(state=tk.NORMAL)
-
-    def _show_error(self, message: str) -> None:
-        """
-        Display an error message to the user.
-
-        Args:
-            message (str): The error message to display.
-        """
-
-        self.error_label.config(text=message)
-
-    def _on_register(self) -> None:
-        """
-        Switch to registration frame.
-        """
-        # Get the parent container (dialog body_frame)
-        parent = self.master
-
-        # Destroy current frame
-        self.destroy()
-
-        # Create and pack the RegisterFrame
-        register_frame = RegisterFrame(parent, self.app)  # type: ignore
-        register_frame.pack(fill=tk.BOTH, expand=True)
-
     def _on_return(self) -> None:
         """
         Handle return action to go back to the previous frame.
@@ -477,6 +435,24 @@ class UploadProfilePictureFrame(ttk.Frame):
         self.crop_size = 316
         self.canvas_size = 320
         self._drag_start: tuple[int, int] | None = None
+        self._interactive = False
+        self._finalize_job: str | None = None
+
+        # Downsample once for the interactive preview, the full resolution
+        # original is only used for the final crop
+        max_preview = int(self.canvas_size * 4)
+        shortest_side = min(self.original_image.width, self.original_image.height)
+        if shortest_side > max_preview:
+            preview_ratio = max_preview / shortest_side
+            self._preview_source = self.original_image.resize(
+                (
+                    max(1, int(self.original_image.width * preview_ratio)),
+                    max(1, int(self.original_image.height * preview_ratio)),
+                ),
+                Image.Resampling.LANCZOS,
+            )
+        else:
+            self._preview_source = self.original_image
 
         self.canvas = tk.Canvas(
             self,
@@ -559,8 +535,14 @@ class UploadProfilePictureFrame(ttk.Frame):
         display_width = max(1, int(self.original_image.width * self._scale))
         display_height = max(1, int(self.original_image.height * self._scale))
         self._display_size = (display_width, display_height)
-        resized = self.original_image.resize(
-            (display_width, display_height), Image.Resampling.LANCZOS
+        self._update_bounds()
+        resample = (
+            Image.Resampling.BILINEAR
+            if self._interactive
+            else Image.Resampling.LANCZOS
+        )
+        resized = self._preview_source.resize(
+            (display_width, display_height), resample
         )
         self._photo = ImageTk.PhotoImage(resized)
 
@@ -584,9 +566,9 @@ class UploadProfilePictureFrame(ttk.Frame):
         if hasattr(self, "crop_rect"):
             self.canvas.tag_raise(self.crop_rect)
 
-    def _clamp_center(self, cx: float, cy: float) -> tuple[float, float]:
+    def _update_bounds(self) -> None:
         """
-        Keep the image covering the crop square.
+        Compute the allowed image center bounds for the current display size.
         """
 
         half_w = self._display_size[0] / 2
@@ -602,9 +584,15 @@ class UploadProfilePictureFrame(ttk.Frame):
         if min_cy > max_cy:
             min_cy = max_cy = (min_cy + max_cy) / 2
 
-        cx = min(max(cx, min_cx), max_cx)
-        cy = min(max(cy, min_cy), max_cy)
-        return cx, cy
+        self._bounds = (min_cx, max_cx, min_cy, max_cy)
+
+    def _clamp_center(self, cx: float, cy: float) -> tuple[float, float]:
+        """
+        Keep the image covering the crop square.
+        """
+
+        min_cx, max_cx, min_cy, max_cy = self._bounds
+        return min(max(cx, min_cx), max_cx), min(max(cy, min_cy), max_cy)
 
     def _start_drag(self, event) -> None:
         self._drag_start = (event.x, event.y)
@@ -633,6 +621,17 @@ class UploadProfilePictureFrame(ttk.Frame):
         if new_scale == self._scale:
             return
         self._scale = new_scale
+        self._interactive = True
+        self._render_image()
+
+        # Render the final frame with LANCZOS once the zoom settles
+        if self._finalize_job is not None:
+            self.after_cancel(self._finalize_job)
+        self._finalize_job = self.after(120, self._finalize_render)
+
+    def _finalize_render(self) -> None:
+        self._finalize_job = None
+        self._interactive = False
         self._render_image()
 
     def _on_cancel(self) -> None:
@@ -643,9 +642,12 @@ class UploadProfilePictureFrame(ttk.Frame):
     def _on_upload(self) -> None:
         if getattr(self, "_uploading", False):
             return
+        if not self.app.username:
+            self._on_upload_error("Utilisateur non connecté.")
+            return
         self._set_upload_state(True)
-        thread = threading.Thread(target=self._upload_worker, daemon=True)
-        thread.start()
+        # Only the crop box is read on the Tk thread, the crop itself is done by a worker
+        self.app.run_async(self._upload_async(self._get_crop_box()))
 
     def _set_upload_state(self, uploading: bool) -> None:
         self._uploading = uploading
@@ -655,45 +657,79 @@ class UploadProfilePictureFrame(ttk.Frame):
         if uploading:
             self.error_label.config(text="Envoi en cours...")
 
-    def _upload_worker(self) -> None:
-        try:
-            if not self.app.username:
-                raise ValueError("Utilisateur non connecté.")
+    async def _upload_async(self, crop_box: tuple[int, int, int, int] | None) -> None:
+        """
+        Upload the cropped picture while it is being cropped and encoded.
+
+        The multipart body is streamed, so the connection to the backend is
+        established while the crop and the WEBP encoding still run in a worker thread.
 
-            cropped = self._get_cropped_image()
-            buffer = BytesIO()
-            cropped.save(buffer, format="WEBP")
-            buffer.seek(0)
+        Args:
+            crop_box (tuple[int, int, int, int] | None): The area of the original
+                picture to keep, None to keep it whole.
+        """
+
+        async def encode() -> bytes:
+            cropped = await asyncio.to_thread(self._crop_image, crop_box)
+            return await asyncio.to_thread(self._encode_webp, cropped)
 
-            response = requests.post(
+        encode_task = asyncio.create_task(encode())
+        try:
+            boundary = secrets.token_hex(16)
+
+            async def body():
+                yield (
+                    f"--{boundary}\r\n"
+                    'Content-Disposition: form-data; name="file"; '
+                    'filename="profile_picture.webp"\r\n'
+                    "Content-Type: image/webp\r\n\r\n"
+                ).encode()
+                yield await encode_task
+                yield f"\r\n--{boundary}--\r\n".encode()
+
+            response = await self.app.http.post(
                 f"{BASE_URL}/users/{self.app.username}/profile-picture",
-                files={
-                    "file": (
-                        "profile_picture.webp",
-                        buffer.getvalue(),
-                        "image/webp",
-                    )
-                },
+                content=body(),
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
                 timeout=10,
             )
+            data = await encode_task
 
             if response.status_code not in (200, 201):
                 raise ValueError("Erreur lors de l'envoi de l'image.")
 
-            output_path = (
-                Path(BASE_FOLDER_PATH)
-                / "gui"
-                / "images"
-                / "profiles"
-                / "current_profile_picture.webp"
-            )
+            output_path = _PROFILES_DIR / "current_profile_picture.webp"
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            cropped.save(output_path, format="WEBP")
+            output_path.write_bytes(data)
 
-            self.app.after(0, lambda: self._on_upload_success(output_path))
+            self.app.after(0, self._on_upload_success, output_path)
 
         except Exception as exc:
-            self.app.after(0, lambda: self._on_upload_error(str(exc)))
+            self.app.after(0, self._on_upload_error, str(exc))
+
+        finally:
+            # The request may fail before the body awaited the encoding task
+            encode_task.cancel()
+            try:
+                await encode_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    @staticmethod
+    def _encode_webp(image: Image.Image) -> bytes:
+        """
+        Encode an image to WEBP.
+
+        Args:
+            image (Image.Image): The image to encode.
+
+        Returns:
+            bytes: The encoded image.
+        """
+
+        buffer = BytesIO()
+        image.save(buffer, format="WEBP", method=4)
+        return buffer.getvalue()
 
     def _on_upload_success(self, output_path: Path) -> None:
         self._set_upload_state(False)
@@ -707,9 +743,18 @@ class UploadProfilePictureFrame(ttk.Frame):
         self._set_upload_state(False)
         self.error_label.config(text=message)
 
-    def _get_cropped_image(self) -> Image.Image:
+    def _get_crop_box(self) -> tuple[int, int, int, int] | None:
+        """
+        Get the area of the original picture inside the crop frame.
+
+        Reads the preview position from the canvas, so it must run on the Tk thread.
+
+        Returns:
+            tuple[int, int, int, int] | None: The crop box, None if the preview
+                is not shown.
+        """
         if self._image_id is None:
-            return self.original_image
+            return None
 
         cx, cy = self.canvas.coords(self._image_id)
         display_w, display_h = self._display_size
@@ -726,14 +771,30 @@ class UploadProfilePictureFrame(ttk.Frame):
         crop_right = max(0, min(self.original_image.width, crop_right))
         crop_bottom = max(0, min(self.original_image.height, crop_bottom))
 
-        cropped = self.original_image.crop(
-            (
-                int(round(crop_left)),
-                int(round(crop_top)),
-                int(round(crop_right)),
-                int(round(crop_bottom)),
-            )
+        return (
+            int(round(crop_left)),
+            int(round(crop_top)),
+            int(round(crop_right)),
+            int(round(crop_bottom)),
         )
+
+    def _crop_image(self, crop_box: tuple[int, int, int, int] | None) -> Image.Image:
+        """
+        Crop the original picture and resize it to the profile picture size.
+
+        Only uses PIL, so it can run in a worker thread.
+
+        Args:
+            crop_box (tuple[int, int, int, int] | None): The area to keep, None to
+                keep the whole picture.
+
+        Returns:
+            Image.Image: The cropped picture.
+        """
+        if crop_box is None:
+            return self.original_image
+
+        cropped = self.original_image.crop(crop_box)
         return cropped.resize(
             (self.crop_size, self.crop_size), Image.Resampling.LANCZOS
         )
@@ -6,15 +6,18 @@ Includes both multiplayer and single-player game frames with full game logic,
 board rendering, stone animations, and game controls.
 """
 
+import functools
 import re
 import threading
+import time
 import multiprocessing
 import queue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import messagebox
 from pathlib import Path
+import numpy as np
 from PIL import Image, ImageTk
 
 from gui.game_canvas import StoneBowl
@@ -26,10 +29,34 @@ from player.ai import Martin, Leo, Magnus, KatagoAI, Player
 
 from config import BASE_FOLDER_PATH
 
+_IMAGES_DIR = Path(BASE_FOLDER_PATH) / "gui" / "images" / "board"
+
+# Number of stones rendered in each bowl, the others are created when needed
+_BOWL_VISIBLE_STONES = 24
+
 if TYPE_CHECKING:
     from gui.app import App
 
 
+@functools.lru_cache(maxsize=None)
+def _load_raw(name: str) -> Image.Image | None:
+    """
+    Decode one of the small board images (stones, bowls) once per process.
+
+    Args:
+        name (str): The file name of the image.
+
+    Returns:
+        Image.Image | None: The decoded RGBA image, or None if the file does not exist.
+    """
+
+    try:
+        with Image.open(_IMAGES_DIR / name) as image:
+            return image.convert("RGBA")
+    except FileNotFoundError:
+        return None
+
+
 def _ai_move_worker(game_state: dict, ai_kind: str, color: int, out_queue) -> None:
     from player.ai import compute_ai_move
 
@@ -44,6 +71,16 @@ class GameFrame(ttk.Frame):
     Handles the game board display, controls, and game state updates.
     """
 
+    # Resized board images, keyed by (board size, board size in pixels), shared
+    # by all the game frames so a new game does not resize them again
+    _image_cache: dict[tuple[int, int], dict] = {}
+
+    # Board images that could not be found, so they are not looked up again
+    _missing_images: set[str] = set()
+
+    # Color played by the AI, if any
+    ai_color: int | None = None
+
     def __init__(
         self,
         parent: ttk.Frame,
@@ -76,6 +113,14 @@ class GameFrame(ttk.Frame):
 
         # Manage the animations
         self.animating = False
+        self._on_animation_done: Callable[[], None] | None = None
+
+        # Canvas items of the stones on the board, by intersection
+        self._stone_items: dict[tuple[int, int], int] = {}
+
+        # Last values shown in the players panels, to skip unchanged updates
+        self._last_turn_color: int | None = None
+        self._last_scores: dict[int, int] | None = None
 
         # Initialize the game
         self.game = game
@@ -125,18 +170,10 @@ class GameFrame(ttk.Frame):
         self._create_players_panels()
 
         # Create canvas for drawing the board using calculated dimensions
-        board_width = int(self.image_total_size * self.scale_ratio)
-        board_height = int(self.image_total_size * self.scale_ratio)
-        bowl_size = int(board_width / 4)
-        margin = bowl_size + 20
-
-        canvas_width = board_width + margin * 2
-        canvas_height = board_height
-
         self.canvas = tk.Canvas(
             self.board_frame,
-            width=canvas_width,
-            height=canvas_height,
+            width=self.canvas_width,
+            height=self.board_px,
             relief=tk.SOLID,
             bd=0,
             highlightthickness=0,  # Remove canvas border highlight
@@ -145,12 +182,18 @@ class GameFrame(ttk.Frame):
         self.canvas.grid(row=1, column=0, padx=20, pady=20)
         self.canvas.bind("<Button-1>", self._on_board_click)
 
+        # Last move marker, moved and shown by _highlight_last_move
+        self._overlay_id = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="red", width=2, state="hidden", tags=("overlay",)
+        )
+
         # Origin for drawing the board
-        self.board_origin_x = margin
+        self.board_origin_x = self.margin
         self.board_origin_y = 0
+        self._build_coordinate_tables()
 
         # Create bowls
-        self._create_bowls()
+        self._create_bowls(ai_side=self.ai_color)
 
         self.after(0, self._build_layout_step_3)
 
@@ -227,7 +270,7 @@ class GameFrame(ttk.Frame):
         self.app.current_game = self.game
 
         # Play game start sound
-        self.sound_manager.play_exclusive("game_start_music")
+        self.sound_manager.post("game_start_music")
 
         # Resume game if provided
         if self.game is not None:
@@ -246,8 +289,6 @@ class GameFrame(ttk.Frame):
         Important: Each goban image has a 100-pixel border that needs to be accounted for.
         The full image is 2000x2000 pixels (100 border + 1800 grid + 100 border).
         """
-        images_dir = Path(BASE_FOLDER_PATH) / "gui" / "images" / "board"
-
         # Original image dimensions and border
         self.border_pixels_original = 105  # 100-pixel border on the original image
         self.image_grid_size = 1800  # The grid on the image is 1800 pixels
@@ -290,10 +331,28 @@ class GameFrame(ttk.Frame):
         # Calculate the border size on the resized image
         self.border_pixels_resized = self.border_pixels_original * self.scale_ratio
 
+        # Canvas layout: the board with a bowl on each side
+        self.board_px = int(self.image_total_size * self.scale_ratio)
+        self.bowl_size = int(self.board_px / 4)
+        self.margin = self.bowl_size + 20
+        self.canvas_width = self.board_px + self.margin * 2
+
+        # Reuse the images already resized for this board
+        cache_key = (self.board_size, board_size_px)
+        cached = GameFrame._image_cache.get(cache_key)
+        if cached is not None:
+            for name, value in cached.items():
+                setattr(self, name, value)
+            return
+
         # Load goban image
-        goban_path = images_dir / f"{self.board_size}x{self.board_size}_goban.png"
-        if goban_path.exists():
-            goban_img = Image.open(goban_path)
+        goban_img = self._open_image(f"{self.board_size}x{self.board_size}_goban.png")
+        if goban_img is not None:
+            # Box-reduce by an integer factor first, so LANCZOS runs on a
+            # source at most about twice the final size
+            factor = goban_img.width // (board_width * 2)
+            if factor > 1:
+                goban_img = goban_img.reduce(factor)
             # Resize goban to calculated dimensions (full image with border)
             goban_img = goban_img.resize(
                 (board_width, board_height), Image.Resampling.LANCZOS
@@ -302,70 +361,132 @@ class GameFrame(ttk.Frame):
         self.app.pulse_loading()
 
         # Load black stone image
-        black_stone_path = images_dir / "black_stone.png"
-        if black_stone_path.exists():
-            black_stone_img = Image.open(black_stone_path)
+        black_stone_img = _load_raw("black_stone.png")
+        if black_stone_img is not None:
             # Resize stone to match cell size with a margin
             stone_size = int(self.cell_size * 0.85)  # 85% of cell size for margin
             black_stone_img = black_stone_img.resize(
-                (stone_size, stone_size), Image.Resampling.LANCZOS
+                (stone_size, stone_size), Image.Resampling.BICUBIC
             )
             self.black_stone_photo = ImageTk.PhotoImage(black_stone_img)
             self.stone_size = stone_size
         self.app.pulse_loading()
 
         # Load white stone image
-        white_stone_path = images_dir / "white_stone.png"
-        if white_stone_path.exists():
-            white_stone_img = Image.open(white_stone_path)
+        white_stone_img = _load_raw("white_stone.png")
+        if white_stone_img is not None:
             # Resize stone to match cell size with a margin
             stone_size = int(self.cell_size * 0.85)  # 85% of cell size for margin
             white_stone_img = white_stone_img.resize(
-                (stone_size, stone_size), Image.Resampling.LANCZOS
+                (stone_size, stone_size), Image.Resampling.BICUBIC
             )
             self.white_stone_photo = ImageTk.PhotoImage(white_stone_img)
         self.app.pulse_loading()
 
         # Load bowl images
-        bowl_back_path = images_dir / "bowl.png"
-        bowl_front_path = images_dir / "bowl_border.png"
-        if bowl_back_path.exists() and bowl_front_path.exists():
-            bowl_back_img = Image.open(bowl_back_path)
-            bowl_front_img = Image.open(bowl_front_path)
+        bowl_back_img = _load_raw("bowl.png")
+        bowl_front_img = _load_raw("bowl_border.png")
+        if bowl_back_img is not None and bowl_front_img is not None:
             bowl_size = int(board_size_px / 4)  # Bowl size relative to board size
             bowl_back_img = bowl_back_img.resize(
-                (bowl_size, bowl_size), Image.Resampling.LANCZOS
+                (bowl_size, bowl_size), Image.Resampling.BICUBIC
             )
             bowl_front_img = bowl_front_img.resize(
-                (bowl_size, bowl_size), Image.Resampling.LANCZOS
+                (bowl_size, bowl_size), Image.Resampling.BICUBIC
             )
             self.bowl_back_photo = ImageTk.PhotoImage(bowl_back_img)
             self.bowl_front_photo = ImageTk.PhotoImage(bowl_front_img)
         self.app.pulse_loading()
 
-    def _create_bowls(self) -> None:
+        GameFrame._image_cache[cache_key] = {
+            name: getattr(self, name)
+            for name in (
+                "goban_photo",
+                "black_stone_photo",
+                "white_stone_photo",
+                "stone_size",
+                "bowl_back_photo",
+                "bowl_front_photo",
+            )
+            if hasattr(self, name)
+        }
+
+    @classmethod
+    def _open_image(cls, name: str) -> Image.Image | None:
         """
-        Place the stone bowls on the canvas.
+        Open an image of the board images directory.
+
+        Args:
+            name (str): The file name of the image.
+
+        Returns:
+            Image.Image | None: The opened image, or None if the file does not exist.
         """
 
-        board_width = int(self.image_total_size * self.scale_ratio)
-        board_height = int(self.image_total_size * self.scale_ratio)
+        if name in cls._missing_images:
+            return None
 
-        bowl_size = int(board_width / 4)
-        margin = bowl_size + 20
+        try:
+            return Image.open(_IMAGES_DIR / name)
+        except FileNotFoundError:
+            cls._missing_images.add(name)
+            return None
 
-        canvas_width = board_width + margin * 2
-        canvas_height = board_height
+    def _build_coordinate_tables(self) -> None:
+        """
+        Precompute the canvas coordinates of the board columns and rows.
 
-        # Center of the two bowls
-        white_bowl_center = (
-            bowl_size // 2,
-            bowl_size // 2,
+        Each intersection is rounded to the nearest pixel on its own, so the grid
+        stays aligned with the goban image without accumulating rounding errors.
+        """
+
+        col_start = self.board_origin_x + self.border_pixels_resized
+        row_start = self.board_origin_y + self.border_pixels_resized
+        self._col_px = tuple(
+            round(col_start + j * self.cell_size) for j in range(self.board_size)
         )
-        black_bowl_center = (
-            canvas_width - bowl_size // 2,
-            canvas_height - bowl_size // 2,
+        self._row_px = tuple(
+            round(row_start + i * self.cell_size) for i in range(self.board_size)
+        )
+        self._inv_cell_size = 1.0 / self.cell_size
+
+        # Top-left corner of a stone image centered on each intersection
+        half_w = self.black_stone_photo.width() // 2  # type: ignore
+        half_h = self.black_stone_photo.height() // 2  # type: ignore
+        self._coord_table = tuple(
+            tuple((cx - half_w, cy - half_h) for cx in self._col_px)
+            for cy in self._row_px
+        )
+
+        # Clickable area: half a cell around the outermost intersections
+        half_cell = self.cell_size / 2
+        span = self.board_size * self.cell_size
+        self._click_x0 = col_start - half_cell
+        self._click_y0 = row_start - half_cell
+        self._click_x1 = self._click_x0 + span
+        self._click_y1 = self._click_y0 + span
+
+    def _create_bowls(self, ai_side: int | None = None) -> None:
+        """
+        Place the stone bowls on the canvas.
+
+        Args:
+            ai_side (int, optional): The color played by the AI, whose bowl is
+                placed at the top left. Defaults to None (white at the top left).
+        """
+
+        bowl_size = self.bowl_size
+
+        # Center of the two bowls
+        top_left = (bowl_size // 2, bowl_size // 2)
+        bottom_right = (
+            self.canvas_width - bowl_size // 2,
+            self.board_px - bowl_size // 2,
         )
+        if ai_side == Goban.BLACK:
+            black_bowl_center, white_bowl_center = top_left, bottom_right
+        else:
+            white_bowl_center, black_bowl_center = top_left, bottom_right
 
         # Bowls
         self.white_bowl = StoneBowl(
@@ -376,7 +497,8 @@ class GameFrame(ttk.Frame):
             stone_image=self.white_stone_photo,  # type: ignore
             bowl_back=self.bowl_back_photo,
             bowl_front=self.bowl_front_photo,
-            initial_count=self.board_size**2,
+            initial_count=min(_BOWL_VISIBLE_STONES, self.board_size**2),
+            total_count=self.board_size**2,
         )
 
         self.black_bowl = StoneBowl(
@@ -387,7 +509,8 @@ class GameFrame(ttk.Frame):
             stone_image=self.black_stone_photo,  # type: ignore
             bowl_back=self.bowl_back_photo,
             bowl_front=self.bowl_front_photo,
-            initial_count=self.board_size**2,
+            initial_count=min(_BOWL_VISIBLE_STONES, self.board_size**2),
+            total_count=self.board_size**2,
         )
 
     def _create_players_panels(self):
@@ -494,18 +617,10 @@ class GameFrame(ttk.Frame):
         self._create_players_panels()
 
         # Create canvas for drawing the board using calculated dimensions
-        board_width = int(self.image_total_size * self.scale_ratio)
-        board_height = int(self.image_total_size * self.scale_ratio)
-        bowl_size = int(board_width / 4)
-        margin = bowl_size + 20
-
-        canvas_width = board_width + margin * 2
-        canvas_height = board_height
-
         self.canvas = tk.Canvas(
             self.board_frame,
-            width=canvas_width,
-            height=canvas_height,
+            width=self.canvas_width,
+            height=self.board_px,
             relief=tk.SOLID,
             bd=0,
             highlightthickness=0,  # Remove canvas border highlight
@@ -514,12 +629,18 @@ class GameFrame(ttk.Frame):
         self.canvas.grid(row=1, column=0, padx=20, pady=20)
         self.canvas.bind("<Button-1>", self._on_board_click)
 
+        # Last move marker, moved and shown by _highlight_last_move
+        self._overlay_id = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="red", width=2, state="hidden", tags=("overlay",)
+        )
+
         # Origin for drawing the board
-        self.board_origin_x = margin
+        self.board_origin_x = self.margin
         self.board_origin_y = 0
+        self._build_coordinate_tables()
 
         # Create bowls
-        self._create_bowls()
+        self._create_bowls(ai_side=self.ai_color)
 
         # Right side: Controls and info panel
         right_frame = ttk.Frame(main_frame)
@@ -609,7 +730,7 @@ class GameFrame(ttk.Frame):
         self.canvas.delete("background")
         self.canvas.delete("bowls")
         self.canvas.delete("stones")
-        self.canvas.delete("overlay")
+        self._stone_items.clear()
 
         # Draw goban image as background
         # Position image at (board_origin, board_origin) - image already includes border
@@ -625,11 +746,12 @@ class GameFrame(ttk.Frame):
         self.white_bowl.draw()
         self.black_bowl.draw()
 
-        # Draw stones
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if self.game.goban.board[x, y] != Goban.EMPTY:
-                    self._draw_stone(x, y, self.game.goban.board[x, y])
+        # Draw stones, only visiting the occupied intersections
+        board = self.game.goban.board
+        occupied = np.argwhere(board != Goban.EMPTY)
+        colors = board[occupied[:, 0], occupied[:, 1]]
+        for (x, y), color in zip(occupied.tolist(), colors.tolist()):
+            self._draw_stone(x, y, color)
 
         self.canvas.tag_raise("stones")
         self.canvas.tag_raise("overlay")
@@ -643,14 +765,14 @@ class GameFrame(ttk.Frame):
             y (int): The y-coordinate (column) of the stone.
             color (int): The stone color (Goban.BLACK=1 or Goban.WHITE=2).
         """
-        cx = self.board_origin_x + self.border_pixels_resized + y * self.cell_size
-        cy = self.board_origin_y + self.border_pixels_resized + x * self.cell_size
+        cx = self._col_px[y]
+        cy = self._row_px[x]
 
         image = (
             self.black_stone_photo if color == Goban.BLACK else self.white_stone_photo
         )
 
-        self.canvas.create_image(
+        self._stone_items[(x, y)] = self.canvas.create_image(
             cx,
             cy,
             image=image,
@@ -658,63 +780,46 @@ class GameFrame(ttk.Frame):
             tags=("stones",),
         )
 
-    def _highlight_last_move(self) -> None:
+    def _remove_captured_stones(self) -> None:
         """
-        Highlight the last move played on the board with a small square.
+        Delete the stones captured by the last move from the canvas.
         """
-        if self.last_move:
-            x, y = self.last_move
-            cx = self.board_origin_x + self.border_pixels_resized + y * self.cell_size
-            cy = self.board_origin_y + self.border_pixels_resized + x * self.cell_size
-            marker_size = 4
-            self.canvas.delete("overlay")
-            self.canvas.create_rectangle(
-                cx - marker_size,
-                cy - marker_size,
-                cx + marker_size,
-                cy + marker_size,
-                outline="red",
-                width=2,
-                tags=("overlay",),
-            )
+        for coords in self.game.last_captured:
+            item = self._stone_items.pop(coords, None)
+            if item is not None:
+                self.canvas.delete(item)
 
-    def _animate_pass(self, steps: int = 40, delay: int = 20) -> None:
+    def _highlight_last_move(self) -> None:
         """
-        Animate a pass action.
+        Highlight the last move played on the board with a small square.
         """
+        if not self.last_move:
+            self.canvas.itemconfigure(self._overlay_id, state="hidden")
+            return
 
-        self.animating = True
-        self.canvas.delete("overlay")
-
-        def step(i: int = 0):
-            if i >= steps:
-                self._draw_board()
-                self.sound_manager.play_exclusive("pass_effect")
-                self._update_display()
-                self.animating = False
-                return
+        x, y = self.last_move
+        cx = self._col_px[y]
+        cy = self._row_px[x]
+        marker_size = 4
+        self.canvas.coords(
+            self._overlay_id,
+            cx - marker_size,
+            cy - marker_size,
+            cx + marker_size,
+            cy + marker_size,
+        )
+        self.canvas.itemconfigure(self._overlay_id, state="normal")
+        self.canvas.tag_raise(self._overlay_id)
 
-            t = i / steps
-            # Simple animation effect (e.g., fade in/out)
-            alpha = 1 - abs(t - 0.5) * 2
-            self.canvas.delete("overlay")
-            self.canvas.create_rectangle(
-                self.board_origin_x + self.border_pixels_resized,
-                self.board_origin_y + self.border_pixels_resized,
-                self.board_origin_x
-                + self.border_pixels_resized
-                + (self.board_size - 1) * self.cell_size,
-                self.board_origin_y
-                + self.border_pixels_resized
-                + (self.board_size - 1) * self.cell_size,
-                outline="red",
-                width=2,
-                tags=("overlay",),
-            )
-            # Schedule next step
-            self.after(delay, lambda: step(i + 1))
+    def _end_animation(self) -> None:
+        """
+        Mark the running animation as finished and run the pending callback.
+        """
 
-        step()
+        self.animating = False
+        if self._on_animation_done is not None:
+            callback, self._on_animation_done = self._on_animation_done, None
+            self.after_idle(callback)
 
     def _animate_stone(
         self,
@@ -726,62 +831,102 @@ class GameFrame(ttk.Frame):
     ) -> None:
         """
         Animate a stone canvas item toward a target position.
+
+        The animation lasts steps * delay milliseconds. Each tick places the stone
+        from the elapsed time, so late ticks catch up instead of slowing it down.
         """
 
         x0, y0 = self.canvas.coords(item)
         x1, y1 = target
 
-        def ease_out(t: float) -> float:
-            return 1 - (1 - t) ** 3
-
         self.animating = True
         self.canvas.tag_raise(item)
 
-        def step(i: int = 0):
-            if i >= steps:
-                self.canvas.coords(item, x1, y1)
-                self.canvas.delete(item)
-
-                self._draw_stone(*self.last_move, self.game.goban.board[self.last_move])  # type: ignore
-
-                if capture:
-                    self._draw_board()
-                    self.sound_manager.play_exclusive("capture_effect")
-                else:
-                    self.sound_manager.play_exclusive("stone_placed_effect")
+        self._animate_step(
+            item,
+            x1 - x0,
+            y1 - y0,
+            time.monotonic(),
+            steps * delay / 1000,
+            delay,
+            capture,
+        )
 
-                self._update_display()
+    def _animate_step(
+        self,
+        item: int,
+        dx: float,
+        dy: float,
+        start: float,
+        duration: float,
+        delay: int,
+        capture: bool,
+        moved_x: float = 0.0,
+        moved_y: float = 0.0,
+    ) -> None:
+        """
+        Move the animated stone to its eased position for the elapsed time.
 
-                self.animating = False
-                return
+        Args:
+            item (int): The canvas item of the stone.
+            dx (float): The total horizontal distance to travel.
+            dy (float): The total vertical distance to travel.
+            start (float): The time.monotonic() value when the animation started.
+            duration (float): The duration of the animation in seconds.
+            delay (int): The delay between two ticks in milliseconds.
+            capture (bool): Whether the move captured stones.
+            moved_x (float): The horizontal distance already applied.
+            moved_y (float): The vertical distance already applied.
+        """
+
+        t = (time.monotonic() - start) / duration
+        if t >= 1.0:
+            self.canvas.delete(item)
+
+            self._draw_stone(*self.last_move, self.game.goban.board[self.last_move])  # type: ignore
+
+            if capture:
+                self._remove_captured_stones()
+                self.sound_manager.post("capture_effect")
+            else:
+                self.sound_manager.post("stone_placed_effect")
 
-            t = ease_out(i / steps)
-            nx = x0 + (x1 - x0) * t
-            ny = y0 + (y1 - y0) * t
+            self._update_display()
 
-            self.canvas.coords(item, nx, ny)
-            self.after(delay, lambda: step(i + 1))
+            self._end_animation()
+            return
 
-        step()
+        # Ease-out cubic, moved relative to the last applied position
+        ease = 1 - (1 - t) ** 3
+        ex, ey = ease * dx, ease * dy
+        self.canvas.move(item, ex - moved_x, ey - moved_y)
+        self.after(
+            delay,
+            self._animate_step,
+            item,
+            dx,
+            dy,
+            start,
+            duration,
+            delay,
+            capture,
+            ex,
+            ey,
+        )
 
-    def _intersection_coords(self, x: int, y: int) -> tuple[float, float]:
+    def _stone_corner_coords(self, x: int, y: int) -> tuple[int, int]:
         """
-        Get the canvas coordinates of a board intersection.
+        Get the canvas position of a stone image placed on a board intersection.
 
         Args:
             x (int): The x-coordinate (row) of the intersection.
             y (int): The y-coordinate (column) of the intersection.
 
         Returns:
-            tuple[float, float]: The (cx, cy) canvas coordinates of the intersection.
+            tuple[int, int]: The top-left corner of the stone image centered on the
+                intersection, for items anchored "nw".
         """
-        cx = self.board_origin_x + self.border_pixels_resized + y * self.cell_size
-        cy = self.board_origin_y + self.border_pixels_resized + x * self.cell_size
-
-        w = self.black_stone_photo.width()  # type: ignore
-        h = self.black_stone_photo.height()  # type: ignore
-
-        return cx - w // 2, cy - h // 2
+        return self._coord_table[x][y]
 
     def _on_board_click(self, event: tk.Event) -> None:
         """
@@ -795,52 +940,48 @@ class GameFrame(ttk.Frame):
         if self.animating:
             return
 
-        # Subtract the border offset to get position within the grid
-        # Then divide by cell_size to get the grid position
-        # The intersections are at: border + i * cell_size for i = 0 to board_size-1
-        grid_x = (
-            event.x - self.border_pixels_resized - self.board_origin_x
-        ) / self.cell_size
-        grid_y = (
-            event.y - self.border_pixels_resized - self.board_origin_y
-        ) / self.cell_size
-
-        # Round to nearest intersection
-        y = round(grid_x)
-        x = round(grid_y)
-
-        # Validate coordinates are within board bounds
-        if 0 <= x < self.board_size and 0 <= y < self.board_size:
-            successfull, capture = self.game.take_move(x, y)
-            if successfull:
-                self.last_move = (x, y)
+        # Ignore clicks outside of the board
+        if not (
+            self._click_x0 <= event.x < self._click_x1
+            and self._click_y0 <= event.y < self._click_y1
+        ):
+            return
 
-                bowl = (
-                    self.black_bowl
-                    if self.game.current_color == Goban.WHITE
-                    else self.white_bowl
-                )
-                item = bowl.pop_stone_item()
+        # The clickable area starts half a cell before the first intersection,
+        # so truncating the grid position rounds to the nearest intersection
+        y = int((event.x - self._click_x0) * self._inv_cell_size)
+        x = int((event.y - self._click_y0) * self._inv_cell_size)
 
-                if item:
-                    target = self._intersection_coords(x, y)
-                    self.last_move = (x, y)
-                    self._animate_stone(item, target, capture=capture)
-                else:
-                    self._draw_stone(x, y, self.game.goban.board[x, y])
-                    if capture:
-                        self._draw_board()
-                        self.sound_manager.play_exclusive("capture_effect")
-                    else:
-                        self.sound_manager.play_exclusive("stone_placed_effect")
-                    self._update_display()
+        successfull, capture = self.game.take_move(x, y)
+        if not successfull:
+            # Play invalid move sound
+            self.sound_manager.post("invalid_move_effect")
+            return
 
-                # Check if game is over
-                if self.game.game_over():
-                    self._show_game_over_dialog()
+        self.last_move = (x, y)
+
+        bowl = (
+            self.black_bowl
+            if self.game.current_color == Goban.WHITE
+            else self.white_bowl
+        )
+        item = bowl.pop_stone_item()
+
+        if item:
+            target = self._stone_corner_coords(x, y)
+            self._animate_stone(item, target, capture=capture)
+        else:
+            self._draw_stone(x, y, self.game.goban.board[x, y])
+            if capture:
+                self._remove_captured_stones()
+                self.sound_manager.post("capture_effect")
             else:
-                # Play invalid move sound
-                self.sound_manager.play_exclusive("invalid_move_effect")
+                self.sound_manager.post("stone_placed_effect")
+            self._update_display()
+
+        # Check if game is over
+        if self.game.game_over():
+            self._show_game_over_dialog()
 
     def _on_pass(self) -> None:
         """
@@ -850,7 +991,7 @@ class GameFrame(ttk.Frame):
         """
         self.game.pass_move()
         # Play pass sound
-        self.sound_manager.play_exclusive("pass_effect")
+        self.sound_manager.post("pass_effect")
         self._update_display()
 
         # Check if game is over after pass
@@ -899,7 +1040,7 @@ class GameFrame(ttk.Frame):
         )
 
         if result:
-            self.sound_manager.play_exclusive("resign_music")
+            self.sound_manager.post("resign_music")
             self._show_game_over_dialog(resigned_by=self.game.current_color)
 
     def _open_settings(self) -> None:
@@ -936,34 +1077,34 @@ class GameFrame(ttk.Frame):
         self._highlight_last_move()
 
         # Update player turn
-        self.black_name.config(
-            foreground=("#ffffff" if self.game.current_color == Goban.BLACK else "grey")
-        )
-        self.black_score_label.config(
-            foreground=("#ffffff" if self.game.current_color == Goban.BLACK else "grey")
-        )
-        self.white_name.config(
-            foreground=("#ffffff" if self.game.current_color == Goban.WHITE else "grey")
-        )
-        self.white_score_label.config(
-            foreground=("#ffffff" if self.game.current_color == Goban.WHITE else "grey")
-        )
+        current_color = self.game.current_color
+        if current_color != self._last_turn_color:
+            self._last_turn_color = current_color
+            black_foreground = "#ffffff" if current_color == Goban.BLACK else "grey"
+            white_foreground = "#ffffff" if current_color == Goban.WHITE else "grey"
+            self.black_name.config(foreground=black_foreground)
+            self.black_score_label.config(foreground=black_foreground)
+            self.white_name.config(foreground=white_foreground)
+            self.white_score_label.config(foreground=white_foreground)
 
         # Update scores
-        self.black_score_label.config(
-            text=re.sub(
-                r"(Score:\s*)[-+]?\d+(?:\.\d+)?",
-                r"\g<1>" + str(self.game.get_score()[Goban.BLACK]),
-                self.black_score_label["text"],
+        scores = self.game.get_score()
+        if scores != self._last_scores:
+            self._last_scores = scores
+            self.black_score_label.config(
+                text=re.sub(
+                    r"(Score:\s*)[-+]?\d+(?:\.\d+)?",
+                    r"\g<1>" + str(scores[Goban.BLACK]),
+                    self.black_score_label["text"],
+                )
             )
-        )
-        self.white_score_label.config(
-            text=re.sub(
-                r"(Score:\s*)[-+]?\d+(?:\.\d+)?",
-                r"\g<1>" + str(self.game.get_score()[Goban.WHITE]),
-                self.white_score_label["text"],
+            self.white_score_label.config(
+                text=re.sub(
+                    r"(Score:\s*)[-+]?\d+(?:\.\d+)?",
+                    r"\g<1>" + str(scores[Goban.WHITE]),
+                    self.white_score_label["text"],
+                )
             )
-        )
         self.app.current_game = self.game  # type: ignore
 
     def _resume_game(self) -> None:
@@ -998,8 +1139,9 @@ class GameFrame(ttk.Frame):
             resigned_by (int, optional): If set, indicates which color resigned.
         """
 
-        black_score = self.game.get_score()[Goban.BLACK]
-        white_score = self.game.get_score()[Goban.WHITE]
+        scores = self.game.get_score()
+        black_score = scores[Goban.BLACK]
+        white_score = scores[Goban.WHITE]
 
         if resigned_by is not None:
             winner = "Les Noirs" if resigned_by == Goban.WHITE else "Les Blancs"
@@ -1019,7 +1161,7 @@ class GameFrame(ttk.Frame):
 
         # Play game over sound if not resigned
         if resigned_by is None:
-            self.sound_manager.play_exclusive("game_over_music")
+            self.sound_manager.post("game_over_music")
 
         # Show detailed score
         score_details = f"\nNoirs: {black_score}\nBlancs: {white_score}"
@@ -1088,69 +1230,6 @@ class SingleplayerGameFrame(GameFrame):
             self.resign_button.config(state=tk.DISABLED)
             self.after(100, self._ai_choose_move_async)
 
-    def _create_bowls(self) -> None:
-        """
-        Place the stone bowls on the canvas.
-        """
-
-        board_width = int(self.image_total_size * self.scale_ratio)
-        board_height = int(self.image_total_size * self.scale_ratio)
-
-        bowl_size = int(board_width / 4)
-        margin = bowl_size + 20
-
-        canvas_width = board_width + margin * 2
-        canvas_height = board_height
-
-        # Center of the two bowls
-        black_bowl_center = (
-            (
-                bowl_size // 2
-                if self.player_color == Goban.WHITE
-                else canvas_width - bowl_size // 2
-            ),
-            (
-                bowl_size // 2
-                if self.player_color == Goban.WHITE
-                else canvas_width - bowl_size // 2
-            ),
-        )
-        white_bowl_center = (
-            (
-                canvas_width - bowl_size // 2
-                if self.player_color == Goban.WHITE
-                else bowl_size // 2
-            ),
-            (
-                canvas_height - bowl_size // 2
-                if self.player_color == Goban.WHITE
-                else bowl_size // 2
-            ),
-        )
-
-        # Bowls
-        self.white_bowl = StoneBowl(
-            canvas=self.canvas,
-            center=white_bowl_center,
-            radius=bowl_size // 2,
-            stone_color=Goban.WHITE,
-            stone_image=self.white_stone_photo,  # type: ignore
-            bowl_back=self.bowl_back_photo,
-            bowl_front=self.bowl_front_photo,
-            initial_count=self.board_size**2,
-        )
-
-        self.black_bowl = StoneBowl(
-            canvas=self.canvas,
-            center=black_bowl_center,
-            radius=bowl_size // 2,
-            stone_color=Goban.BLACK,
-            stone_image=self.black_stone_photo,  # type: ignore
-            bowl_back=self.bowl_back_photo,
-            bowl_front=self.bowl_front_photo,
-            initial_count=self.board_size**2,
-        )
-
     def _create_players_panels(self):
         """
         Place players panels with profile picture, name, levels, score and turn indicator.
@@ -1299,7 +1378,7 @@ class SingleplayerGameFrame(GameFrame):
         """
 
         if self.animating:
-            self.after(100, self._wait_and_play_ai)
+            self._on_animation_done = self._ai_choose_move_async
         else:
             self._ai_choose_move_async()
 
@@ -1393,16 +1472,15 @@ class SingleplayerGameFrame(GameFrame):
                 item = bowl.pop_stone_item()
 
                 if item:
-                    target = self._intersection_coords(x, y)  # type: ignore
-                    self.last_move = (x, y)
+                    target = self._stone_corner_coords(x, y)  # type: ignore
                     self._animate_stone(item, target, capture=capture)
                 else:
                     self._draw_stone(x, y, self.game.goban.board[x, y])  # type: ignore
                     if capture:
-                        self._draw_board()
-                        self.sound_manager.play_exclusive("capture_effect")
+                        self._remove_captured_stones()
+                        self.sound_manager.post("capture_effect")
                     else:
-                        self.sound_manager.play_exclusive("stone_placed_effect")
+                        self.sound_manager.post("stone_placed_effect")
                     self._update_display()
 
                 # Check if game is over
@@ -1410,7 +1488,7 @@ class SingleplayerGameFrame(GameFrame):
                     self._show_game_over_dialog()
             else:
                 # Play invalid move sound
-                self.sound_manager.play_exclusive("invalid_move_effect")
+                self.sound_manager.post("invalid_move_effect")
 
             self.pass_button.config(state=tk.NORMAL)
             self.resign_button.config(state=tk.NORMAL)
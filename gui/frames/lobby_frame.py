@@ -43,19 +43,12 @@ class LobbyFrame(ttk.Frame):
         if not self.app.has_loading():
             self._loading = self.app.show_loading("Chargement du lobby...")
 
-        self.after(0, self._build_step_1)
-
-    def _build_step_1(self) -> None:
-        """
-        First step: background music + account panel wiring.
-        """
-
         # Play background music if sound is not already playing
         if (
             self.app.sound_manager.is_enabled()
             and not self.app.sound_manager.is_playing("background_music")
         ):
-            self.app.sound_manager.play_exclusive("background_music")
+            self.app.sound_manager.post("background_music")
 
         # Ensure account panel is visible on this frame
         if hasattr(self.app, "account_panel") and self.app.account_panel:
@@ -67,64 +60,18 @@ class LobbyFrame(ttk.Frame):
             # Ensure current account info/photo are applied on entry
             self._update_account_info()
 
-        self.after(0, self._build_step_2)
-
-    def _build_step_2(self) -> None:
-        """
-        Second step: title.
-        """
-
         # Title
-        title = tk.Canvas(
-            self,
-            width=600,
-            height=182,
-            relief=tk.FLAT,
-            bd=0,
-            highlightthickness=0,
-            bg="#1e1e1e",
-        )
-        title.create_image(
-            0,
-            0,
-            image=self.app.cs_go_banner,
-            anchor="nw",
-        )
+        title = ttk.Label(self, image=self.app.cs_go_banner, padding=0)
         title.pack(pady=40)
 
-        self.after(0, self._build_step_3)
-
-    def _build_step_3(self) -> None:
-        """
-        Third step: menu and buttons.
-        """
-
         # Menu frame
         main_menu_frame = self.app.Frame(self, bg="black", bd=1)
         main_menu_frame.pack(pady=20, padx=30)
-        self._menu_frame = self.app.Frame(main_menu_frame)
-        self._menu_frame.pack(pady=3, padx=3)
-
-        self._menu_build_steps = [
-            self._build_local_button,
-            self._build_online_button,
-            self._build_settings_button,
-            self._build_return_button,
-        ]
-        self._build_menu_step(0)
-
-    def _build_menu_step(self, index: int) -> None:
-        if index >= len(self._menu_build_steps):
-            if self._loading is not None:
-                self.app.hide_loading(self._loading)
-            return
-
-        self._menu_build_steps[index]()
-        self.after(0, lambda: self._build_menu_step(index + 1))
+        menu_frame = self.app.Frame(main_menu_frame)
+        menu_frame.pack(pady=3, padx=3)
 
-    def _build_local_button(self) -> None:
         self.app.Button(
-            self._menu_frame.content_frame,
+            menu_frame.content_frame,
             overlay_path=self.app.local_icon_path,
             hover_overlay_path=self.app.hovered_local_icon_path,
             text="Partie locale",
@@ -132,21 +79,20 @@ class LobbyFrame(ttk.Frame):
             takefocus=False,
         ).pack(pady=(20, 10), fill=tk.X, padx=30)
 
-    def _build_online_button(self) -> None:
+        self._last_online_state = tk.DISABLED if self.app.name is None else tk.NORMAL
         self.online_button = self.app.Button(
-            self._menu_frame.content_frame,
+            menu_frame.content_frame,
             overlay_path=self.app.online_icon_path,
             hover_overlay_path=self.app.hovered_online_icon_path,
             text="Partie en ligne",
-            state=tk.DISABLED if self.app.name is None else tk.NORMAL,
+            state=self._last_online_state,
             command=lambda: self._open_online_game(),
             takefocus=False,
         )
         self.online_button.pack(pady=10, fill=tk.X, padx=30)
 
-    def _build_settings_button(self) -> None:
         self.app.Button(
-            self._menu_frame.content_frame,
+            menu_frame.content_frame,
             overlay_path=self.app.prefs_icon_path,
             hover_overlay_path=self.app.hovered_prefs_icon_path,
             text="Paramètres",
@@ -154,9 +100,8 @@ class LobbyFrame(ttk.Frame):
             takefocus=False,
         ).pack(pady=10, fill=tk.X, padx=30)
 
-    def _build_return_button(self) -> None:
         self.app.Button(
-            self._menu_frame.content_frame,
+            menu_frame.content_frame,
             overlay_path=self.app.return_icon_path,
             hover_overlay_path=self.app.hovered_return_icon_path,
             text="Retour au bureau",
@@ -164,6 +109,11 @@ class LobbyFrame(ttk.Frame):
             takefocus=False,
         ).pack(pady=(10, 20), fill=tk.X, padx=30)
 
+        # Lay out the whole lobby in a single pass before hiding the loading window
+        self.update_idletasks()
+        if self._loading is not None:
+            self.app.hide_loading(self._loading)
+
     def _open_local_game(self) -> None:
         """
         Open the game starting window.
@@ -172,7 +122,7 @@ class LobbyFrame(ttk.Frame):
             game (GoGame, optional): The game instance to resume. Defaults to None.
         """
 
-        self.app.show_frame(lambda parent, app: LocalLobbyFrame(parent, app))
+        self.app.show_frame(LocalLobbyFrame, key=LocalLobbyFrame)
 
     def _open_online_game(self) -> None:
         """
@@ -223,7 +173,8 @@ class LobbyFrame(ttk.Frame):
         if not self.online_button.winfo_exists():
             return
         # Disable online button if no connection (strength == 0)
-        if strength == 0:
-            self.online_button.config(state=tk.DISABLED)
-        else:
-            self.online_button.config(state=tk.NORMAL)
+        new_state = tk.DISABLED if strength == 0 else tk.NORMAL
+        if new_state == self._last_online_state:
+            return
+        self.online_button.config(state=new_state)
+        self._last_online_state = new_state
@@ -8,6 +8,7 @@ board size and game mode (single player vs multiplayer) before starting a game.
 from typing import TYPE_CHECKING
 import tkinter as tk
 import tkinter.ttk as ttk
+from PIL import ImageTk
 
 from game.core import Goban
 from gui.frames.game_frame import GameFrame, SingleplayerGameFrame
@@ -19,6 +20,15 @@ from game.core import GoGame
 if TYPE_CHECKING:
     from gui.app import App
 
+# Board sizes offered in the lobby
+_BOARD_SIZES = (9, 13, 19)
+
+# Number of players choices: (label, multiplayer value, vertical padding)
+_PLAYER_CHOICES = (
+    ("Un joueur (contre IA)", False, (20, 10)),
+    ("Deux joueurs (local)", True, (10, 20)),
+)
+
 
 class LocalLobbyFrame(ttk.Frame):
     """
@@ -44,7 +54,14 @@ class LocalLobbyFrame(ttk.Frame):
         self.board_size = tk.IntVar(value=19)
         self.multiplayer = tk.BooleanVar(value=True)
         self.ai = None
-        self.after(0, self._build_step_1)
+
+        # Profile photos handed to the players, loaded on first use
+        self._player_photo: tuple[str, ImageTk.PhotoImage] | None = None
+        self._default_photo: ImageTk.PhotoImage | None = None
+
+        # Set once the deferred build steps created all the widgets
+        self._built = False
+        self.after_idle(self._build_step_1)
 
     def _build_step_1(self) -> None:
         # Title
@@ -62,7 +79,7 @@ class LocalLobbyFrame(ttk.Frame):
         if hasattr(self.app, "account_panel") and self.app.account_panel:
             self.app.account_panel.lift()
 
-        self.after(0, self._build_step_2)
+        self.after_idle(self._build_step_2)
 
     def _build_step_2(self) -> None:
         # Number of players selection frame
@@ -72,22 +89,17 @@ class LocalLobbyFrame(ttk.Frame):
         player_frame.pack(pady=3, padx=3, fill=tk.BOTH, expand=True)
 
         # Buttons for number of players
-        ttk.Radiobutton(
-            player_frame.content_frame,
-            text="Un joueur (contre IA)",
-            variable=self.multiplayer,
-            value=False,
-            takefocus=False,
-        ).pack(padx=30, pady=(20, 10), fill=tk.BOTH)
-        ttk.Radiobutton(
-            player_frame.content_frame,
-            text="Deux joueurs (local)",
-            variable=self.multiplayer,
-            value=True,
-            takefocus=False,
-        ).pack(padx=30, pady=(10, 20), fill=tk.BOTH)
-
-        self.after(0, self._build_step_3)
+        for text, value, pady in _PLAYER_CHOICES:
+            ttk.Radiobutton(
+                player_frame.content_frame,
+                text=text,
+                variable=self.multiplayer,
+                value=value,
+                style="Lobby.TRadiobutton",
+                takefocus=False,
+            ).pack(padx=30, pady=pady, fill=tk.BOTH)
+
+        self.after_idle(self._build_step_3)
 
     def _build_step_3(self) -> None:
         # Board size selection frame
@@ -96,39 +108,30 @@ class LocalLobbyFrame(ttk.Frame):
         size_frame = self.app.Frame(main_size_frame)
         size_frame.pack(pady=3, padx=3, fill=tk.BOTH, expand=True)
 
-        # Buttons for different board sizes
-        ttk.Radiobutton(
+        # Board size selection
+        self.size_combobox = ttk.Combobox(
             size_frame.content_frame,
-            text="9x9",
-            variable=self.board_size,
-            value=9,
+            values=[f"{size}x{size}" for size in _BOARD_SIZES],
+            state="readonly",
+            width=8,
+            font=("Skranji", 14),
             takefocus=False,
-        ).pack(padx=30, pady=(20, 10), fill=tk.X)
-        ttk.Radiobutton(
-            size_frame.content_frame,
-            text="13x13",
-            variable=self.board_size,
-            value=13,
-            takefocus=False,
-        ).pack(padx=30, pady=10, fill=tk.X)
-        ttk.Radiobutton(
-            size_frame.content_frame,
-            text="19x19",
-            variable=self.board_size,
-            value=19,
-            takefocus=False,
-        ).pack(padx=30, pady=(10, 20), fill=tk.X)
+        )
+        self.size_combobox.set(f"{self.board_size.get()}x{self.board_size.get()}")
+        self.size_combobox.bind("<<ComboboxSelected>>", self._on_size_selected)
+        self.size_combobox.pack(padx=30, pady=20, fill=tk.X)
 
-        self.after(0, self._build_step_4)
+        self.after_idle(self._build_step_4)
 
     def _build_step_4(self) -> None:
-        self.app.Button(
+        self.resume_button = self.app.Button(
             self,
             text="Continuer la partie",
-            command=lambda: self._resume_game(game=self.app.current_game),  # type: ignore
+            command=self._resume_game,
             state=tk.DISABLED if self.app.current_game is None else tk.NORMAL,
             takefocus=False,
-        ).pack(pady=(20, 10))
+        )
+        self.resume_button.pack(pady=(20, 10))
 
         # Start Game button
         self.app.Button(
@@ -138,26 +141,101 @@ class LocalLobbyFrame(ttk.Frame):
             takefocus=False,
         ).pack(pady=10)
 
-        # Return to Lobby button
-        self.app.Button(
+        # Return to Lobby button, its icon is loaded once the lobby is shown
+        self.return_button = self.app.Button(
             self,
             text="Retour au Lobby",
-            overlay_path=self.app.return_icon_path,
-            hover_overlay_path=self.app.hovered_return_icon_path,
             command=self._return_to_lobby,
             takefocus=False,
-        ).pack(pady=(10, 20))
+        )
+        self.return_button.pack(pady=(10, 20))
+        self._built = True
 
+        # Lay out the whole lobby in a single pass before hiding the loading window
+        self.update_idletasks()
         self.app.hide_loading(self._loading)
+        self.after_idle(self._load_return_icon)
 
-    def _resume_game(self, game: "GoGame") -> None:
+    def _load_return_icon(self) -> None:
         """
-        Resume an existing game.
+        Draw the icons of the return button after the first paint of the lobby.
+        """
+
+        if self.return_button.winfo_exists():
+            self.return_button.set_overlay(
+                self.app.return_icon_path, self.app.hovered_return_icon_path
+            )
+
+    def reset(self) -> None:
+        """
+        Reset the game options before the lobby is shown again by App.show_frame.
+        """
+
+        # The profile photo may have changed since the last visit
+        self._player_photo = None
+
+        # Still building, the widgets are created with the default options
+        if not self._built:
+            return
+
+        self.board_size.set(19)
+        self.size_combobox.set("19x19")
+        self.multiplayer.set(True)
+        self.resume_button.config(
+            state=tk.DISABLED if self.app.current_game is None else tk.NORMAL
+        )
+
+        # Ensure account panel is visible on this frame
+        if hasattr(self.app, "account_panel") and self.app.account_panel:
+            self.app.account_panel.lift()
+
+    def _get_player_photo(self, display_name: str) -> ImageTk.PhotoImage:
+        """
+        Get the profile photo of the local player, loading it once per visit.
 
         Args:
-            game (GoGame): The game instance to resume.
+            display_name (str): The display name of the local player.
+
+        Returns:
+            ImageTk.PhotoImage: The profile photo.
         """
 
+        if self._player_photo is None or self._player_photo[0] != display_name:
+            photo = self.app.get_profile_photo(display_name.split(" ")[0])
+            self._player_photo = (display_name, photo)
+        return self._player_photo[1]
+
+    def _get_default_photo(self) -> ImageTk.PhotoImage:
+        """
+        Get the default profile photo given to the opponent.
+
+        Returns:
+            ImageTk.PhotoImage: The default profile photo.
+        """
+
+        if self._default_photo is None:
+            self._default_photo = self.app._get_default_profile_photo()
+        return self._default_photo
+
+    def _on_size_selected(self, event: tk.Event) -> None:
+        """
+        Store the board size picked in the combobox.
+
+        Args:
+            event (tk.Event): The selection event.
+        """
+
+        self.board_size.set(_BOARD_SIZES[self.size_combobox.current()])
+
+    def _resume_game(self) -> None:
+        """
+        Resume the current game of the application, if any.
+        """
+
+        game = self.app.current_game
+        if game is None:
+            return
+
         board_size = game.goban.size
         if not game.singleplayer:
             display_name = self.app._get_display_name()
@@ -168,13 +246,13 @@ class LocalLobbyFrame(ttk.Frame):
                     board_size,
                     Player(
                         display_name,
-                        self.app.get_profile_photo(display_name.split(" ")[0]),
+                        self._get_player_photo(display_name),
                         color=Goban.BLACK,
                         level=-3000,
                     ),
                     Player(
                         random_username(),
-                        self.app._get_default_profile_photo(),
+                        self._get_default_photo(),
                         color=Goban.WHITE,
                         level=-3000,
                     ),
@@ -182,7 +260,6 @@ class LocalLobbyFrame(ttk.Frame):
                 )
             )
         else:
-            print("Resuming singleplayer game...")
             display_name = self.app._get_display_name()
             self.app.show_frame(
                 lambda parent, app: SingleplayerGameFrame(
@@ -192,7 +269,7 @@ class LocalLobbyFrame(ttk.Frame):
                     KatagoAI("Test", game, Goban.BLACK, -1750),
                     Player(
                         display_name,
-                        self.app.get_profile_photo(display_name.split(" ")[0]),
+                        self._get_player_photo(display_name),
                         color=Goban.WHITE,
                         level=-3000,
                     ),
@@ -209,44 +286,42 @@ class LocalLobbyFrame(ttk.Frame):
             multiplayer (bool): Whether the game is multiplayer. Defaults to True.
             ai (int | None): The AI difficulty level if applicable. Defaults to None.
         """
-        from gui.frames.game_frame import GameFrame, SingleplayerGameFrame
+        multiplayer = self.multiplayer.get()
+        board_size = self.board_size.get()
+        display_name = self.app._get_display_name()
+        game = GoGame(board_size)
 
-        if self.multiplayer.get():
-            display_name = self.app._get_display_name()
-            game = GoGame(self.board_size.get())
+        if multiplayer:
             self.app.show_frame(
                 lambda parent, app: GameFrame(
                     parent,
                     app,
-                    self.board_size.get(),
+                    board_size,
                     Player(
                         display_name,
-                        self.app.get_profile_photo(display_name.split(" ")[0]),
+                        self._get_player_photo(display_name),
                         color=Goban.BLACK,
                         level=-3000,
                     ),
                     Player(
                         random_username(),
-                        self.app._get_default_profile_photo(),
+                        self._get_default_photo(),
                         color=Goban.WHITE,
                         level=-3000,
                     ),
                     game,
                 )
             )
-
-        if not self.multiplayer.get():
-            display_name = self.app._get_display_name()
-            game = GoGame(self.board_size.get())
+        else:
             self.app.show_frame(
                 lambda parent, app: SingleplayerGameFrame(
                     parent,
                     app,
-                    self.board_size.get(),
+                    board_size,
                     KatagoAI("Test", game, Goban.BLACK, -1750),
                     Player(
                         display_name,
-                        self.app.get_profile_photo(display_name.split(" ")[0]),
+                        self._get_player_photo(display_name),
                         color=Goban.WHITE,
                         level=-3000,
                     ),
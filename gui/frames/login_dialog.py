@@ -5,22 +5,55 @@ This module provides the dialog interface for users to log in or register.
 """
 
 from typing import TYPE_CHECKING
+import re
 import tkinter as tk
 import tkinter.ttk as ttk
 import tkinter.messagebox as messagebox
 
-import requests
-import asyncio
-import httpx
-import threading
-
 if TYPE_CHECKING:
     from gui.app import App
-from gui.widgets import TopLevelWindow
+from gui.widgets import TopLevelWindow, bind_mousewheel_scroll
 
 # API base URL
 from config import BASE_URL
 
+# At least 8 characters, with a digit, a lowercase letter, an uppercase letter
+# and a special character
+_PASSWORD_RE = re.compile(
+    r"(?=.*\d)(?=.*[a-z])(?=.*[A-Z])(?=.*[!@#$%^&*()\-_=+\[{\]}\\|;:'\",<.>/?`~]).{8,}",
+    re.DOTALL,
+)
+
+# Lowercase alphanumeric usernames
+_USERNAME_RE = re.compile(r"[a-z0-9]+")
+
+# Options shared by all the entries of the dialog
+_ENTRY_KW = {"font": ("Skranji", 14), "takefocus": True}
+
+
+def _mk_entry(parent: tk.Widget, **extra) -> ttk.Entry:
+    """
+    Create an entry with the options shared by the dialog entries.
+
+    Args:
+        parent (tk.Widget): The parent widget of the entry.
+        **extra: Additional options for this entry.
+
+    Returns:
+        ttk.Entry: The created entry.
+    """
+
+    return ttk.Entry(parent, **_ENTRY_KW, **extra)
+
+
+# Register form fields: (label, entry attribute, top padding, show character)
+_REGISTER_FIELDS = (
+    ("Nom d'utilisateur", "username_entry", 20, ""),
+    ("Nom d'affichage", "name_entry", 20, ""),
+    ("Mot de passe", "password_entry", 10, "*"),
+    ("Confirmer le mot de passe", "confirm_password_entry", 10, "*"),
+)
+
 
 class LoginFrame(ttk.Frame):
     """
@@ -53,32 +86,19 @@ class LoginFrame(ttk.Frame):
         login_frame.pack(pady=3, padx=3, fill=tk.X)
 
         # Username entry
-        self.username_var = tk.StringVar()
         self.app.Label(
             login_frame,
             text="Nom d'utilisateur",
         ).pack(pady=(20, 5), padx=20)
-        self.username_entry = ttk.Entry(
-            login_frame,
-            textvariable=self.username_var,
-            font=("Skranji", 14),
-            takefocus=True,
-        )
+        self.username_entry = _mk_entry(login_frame)
         self.username_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
 
         # Password entry
-        self.password_var = tk.StringVar()
         self.app.Label(
             login_frame,
             text="Mot de passe",
         ).pack(pady=(10, 5), padx=20)
-        self.password_entry = ttk.Entry(
-            login_frame,
-            textvariable=self.password_var,
-            font=("Skranji", 14),
-            takefocus=True,
-            show="*",
-        )
+        self.password_entry = _mk_entry(login_frame, show="*")
         self.password_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
 
         # Login button
@@ -91,6 +111,7 @@ class LoginFrame(ttk.Frame):
             takefocus=False,
         )
         self.login_button.pack(pady=(10, 20), padx=20)
+        self._current_button_state = tk.NORMAL
 
         # Error label
         self.error_label = ttk.Label(
@@ -139,12 +160,8 @@ class LoginFrame(ttk.Frame):
         self.password_entry.bind("<Return>", lambda event: self._login())
 
         # Bind Tab key to navigate between entries
-        self.username_entry.bind(
-            "<Tab>", lambda e: (self.password_entry.focus_set(), "break")[1]
-        )
-        self.password_entry.bind(
-            "<Tab>", lambda e: (self.username_entry.focus_set(), "break")[1]
-        )
+        self.username_entry.bind("<Tab>", self._focus_password)
+        self.password_entry.bind("<Tab>", self._focus_username)
 
         self.app.hide_loading(loading)
 
@@ -153,8 +170,8 @@ class LoginFrame(ttk.Frame):
         Handle user login action.
         """
 
-        username = self.username_var.get()
-        password = self.password_var.get()
+        username = self.username_entry.get()
+        password = self.password_entry.get()
 
         # Check if all fields are filled
         if username == "" or password == "":
@@ -167,13 +184,10 @@ class LoginFrame(ttk.Frame):
         self.username_entry.configure(style="TEntry")
         self.password_entry.configure(style="TEntry")
 
-        self.login_button.config(state=tk.DISABLED)
+        self._set_login_button_state(tk.DISABLED)
         self._login_loading = self.app.show_loading("Connexion...")
 
-        thread = threading.Thread(
-            target=lambda: asyncio.run(self._do_login(username, password))
-        )
-        thread.start()
+        self.app.run_async(self._do_login(username, password))
 
     async def _do_login(self, username: str, password: str) -> None:
         """
@@ -185,17 +199,16 @@ class LoginFrame(ttk.Frame):
         """
 
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.post(
-                    f"{BASE_URL}/auth/login",
-                    params={"username": username, "password": password},
-                )
+            response = await self.app.http.post(
+                f"{BASE_URL}/auth/login",
+                params={"username": username, "password": password},
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    self.app.after(0, self._on_login_success, data)
-                else:
-                    self.app.after(0, self._on_login_error, "Identifiants incorrects")
+            if response.status_code == 200:
+                data = response.json()
+                self.app.after(0, self._on_login_success, data)
+            else:
+                self.app.after(0, self._on_login_error, "Identifiants incorrects")
 
         except Exception as e:
             self.app.after(0, self._on_login_error, str(e))
@@ -234,7 +247,8 @@ class LoginFrame(ttk.Frame):
         if getattr(self, "_login_loading", None) is not None:
             self.app.hide_loading(self._login_loading)
             self._login_loading = None
-        self.login_button.config(state=tk.NORMAL)
+
+        self._set_login_button_state(tk.NORMAL)
         self.username_entry.configure(style="Error.TEntry")
         self.password_entry.configure(style="Error.TEntry")
         self._show_error(error)
@@ -245,10 +259,22 @@ class LoginFrame(ttk.Frame):
             dialog.lift()
             dialog.focus_set()
 
-        # Reset entries and button for retry
-        self.password_var.set("")
-        self.username_var.set("")
-        self.login_button.config(state=tk.NORMAL)
+        # Reset entries for retry
+        self.password_entry.delete(0, tk.END)
+        self.username_entry.delete(0, tk.END)
+
+    def _set_login_button_state(self, state: str) -> None:
+        """
+        Set the state of the login button, skipping the Tk call if unchanged.
+
+        Args:
+            state (str): The new state of the button.
+        """
+
+        if self._current_button_state == state:
+            return
+        self._current_button_state = state
+        self.login_button.config(state=state)
 
     def _show_error(self, message: str) -> None:
         """
@@ -260,6 +286,34 @@ class LoginFrame(ttk.Frame):
 
         self.error_label.config(text=message)
 
+    def _focus_password(self, event: tk.Event) -> str:
+        """
+        Move the focus to the password entry on Tab.
+
+        Args:
+            event (tk.Event): The key event.
+
+        Returns:
+            str: "break" to stop the default focus traversal.
+        """
+
+        self.password_entry.focus_set()
+        return "break"
+
+    def _focus_username(self, event: tk.Event) -> str:
+        """
+        Move the focus to the username entry on Tab.
+
+        Args:
+            event (tk.Event): The key event.
+
+        Returns:
+            str: "break" to stop the default focus traversal.
+        """
+
+        self.username_entry.focus_set()
+        return "break"
+
     def _on_register(self) -> None:
         """
         Switch to registration frame.
@@ -315,7 +369,6 @@ class RegisterFrame(ttk.Frame):
         super().__init__(parent)
         self.app = app
         loading = self.app.show_loading("Chargement...")
-        self._mousewheel_binding = None  # Store binding ID for cleanup
 
         # Title
         title = ttk.Label(self, text="Inscription", style="Title.TLabel")
@@ -339,79 +392,20 @@ class RegisterFrame(ttk.Frame):
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Enable mouse wheel scrolling
-        def _on_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except tk.TclError:
-                # Canvas has been destroyed, binding will be cleaned up
-                pass
-
-        self._mousewheel_binding = self.bind_all("<MouseWheel>", _on_mousewheel)
-
         # Register frame
         main_register_frame = self.app.Frame(scrollable_frame, bg="black", bd=1)
         main_register_frame.pack(pady=20, fill=tk.X, padx=20)
         register_frame = self.app.Frame(main_register_frame)
         register_frame.pack(pady=3, padx=3, fill=tk.X)
 
-        # Username entry
-        self.username_var = tk.StringVar()
-        self.app.Label(
-            register_frame,
-            text="Nom d'utilisateur",
-        ).pack(pady=(20, 5), padx=20)
-        self.username_entry = ttk.Entry(
-            register_frame,
-            textvariable=self.username_var,
-            font=("Skranji", 14),
-            takefocus=True,
-        )
-        self.username_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
-
-        # Name entry
-        self.name_var = tk.StringVar()
-        self.app.Label(
-            register_frame,
-            text="Nom d'affichage",
-        ).pack(pady=(20, 5), padx=20)
-        self.name_entry = ttk.Entry(
-            register_frame,
-            textvariable=self.name_var,
-            font=("Skranji", 14),
-            takefocus=True,
-        )
-        self.name_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
-
-        # Password entry
-        self.password_var = tk.StringVar()
-        self.app.Label(
-            register_frame,
-            text="Mot de passe",
-        ).pack(pady=(10, 5), padx=20)
-        self.password_entry = ttk.Entry(
-            register_frame,
-            textvariable=self.password_var,
-            font=("Skranji", 14),
-            takefocus=True,
-            show="*",
-        )
-        self.password_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
-
-        # Confirm password entry
-        self.confirm_password_var = tk.StringVar()
-        self.app.Label(
-            register_frame,
-            text="Confirmer le mot de passe",
-        ).pack(pady=(10, 5), padx=20)
-        self.confirm_password_entry = ttk.Entry(
-            register_frame,
-            textvariable=self.confirm_password_var,
-            font=("Skranji", 14),
-            takefocus=True,
-            show="*",
-        )
-        self.confirm_password_entry.pack(pady=(0, 10), padx=20, fill=tk.X)
+        # Entries, built from the field table
+        entries = []
+        for label, attribute, pady, show in _REGISTER_FIELDS:
+            self.app.Label(register_frame, text=label).pack(pady=(pady, 5), padx=20)
+            entry = _mk_entry(register_frame, show=show)
+            entry.pack(pady=(0, 10), padx=20, fill=tk.X)
+            setattr(self, attribute, entry)
+            entries.append(entry)
 
         # Register button
         self.register_button = self.app.Button(
@@ -460,38 +454,43 @@ class RegisterFrame(ttk.Frame):
 
         # Bind Enter key to register
         self.bind("<Return>", lambda event: self._handle_register())
-        self.username_entry.bind("<Return>", lambda event: self._handle_register())
-        self.name_entry.bind("<Return>", lambda event: self._handle_register())
-        self.password_entry.bind("<Return>", lambda event: self._handle_register())
-        self.confirm_password_entry.bind(
-            "<Return>", lambda event: self._handle_register()
-        )
 
         # Bind Tab key to navigate between entries
-        self.username_entry.bind(
-            "<Tab>", lambda e: (self.name_entry.focus_set(), "break")[1]
-        )
-        self.name_entry.bind(
-            "<Tab>", lambda e: (self.password_entry.focus_set(), "break")[1]
-        )
-        self.password_entry.bind(
-            "<Tab>", lambda e: (self.confirm_password_entry.focus_set(), "break")[1]
-        )
-        self.confirm_password_entry.bind(
-            "<Tab>", lambda e: (self.username_entry.focus_set(), "break")[1]
-        )
+        for entry, next_entry in zip(entries, entries[1:] + entries[:1]):
+            entry.bind("<Return>", lambda event: self._handle_register())
+            entry.bind(
+                "<Tab>", lambda e, target=next_entry: self._focus_next(e, target)
+            )
+
+        # Enable mouse wheel scrolling
+        bind_mousewheel_scroll(self, canvas)
 
         self.app.hide_loading(loading)
 
+    def _focus_next(self, event: tk.Event, target: tk.Widget) -> str:
+        """
+        Move the focus to the next entry on Tab.
+
+        Args:
+            event (tk.Event): The key event.
+            target (tk.Widget): The entry to focus.
+
+        Returns:
+            str: "break" to stop the default focus traversal.
+        """
+
+        target.focus_set()
+        return "break"
+
     def _handle_register(self) -> None:
         """
         Handle user registration action.
         """
 
-        username = self.username_var.get()
-        name = self.name_var.get()
-        password = self.password_var.get()
-        confirm_password = self.confirm_password_var.get()
+        username = self.username_entry.get()
+        name = self.name_entry.get()
+        password = self.password_entry.get()
+        confirm_password = self.confirm_password_entry.get()
 
         # Check if all fields are filled
         if username == "" or name == "" or password == "" or confirm_password == "":
@@ -507,28 +506,11 @@ class RegisterFrame(ttk.Frame):
             return
 
         # Check if username is only alphanumeric
-        if not username.isalnum() or username != username.lower():
+        if not _USERNAME_RE.fullmatch(username):
             self.username_entry.configure(style="Error.TEntry")
             self._show_error("Le nom d'utilisateur doit être alphanumérique.")
             return
 
-        # Check if username is already taken
-        try:
-            response = requests.get(
-                f"{BASE_URL}/users/{username}",
-                timeout=5,
-            )
-            if response.status_code == 200:
-                self.username_entry.configure(style="Error.TEntry")
-                self._show_error("Le nom d'utilisateur est déjà pris.")
-                return
-
-        except Exception as e:
-            self._show_error(
-                f"Erreur lors de la vérification du nom d'utilisateur : {e}"
-            )
-            return
-
         # Check if passwords match
         if password != confirm_password:
             self.password_entry.configure(style="Error.TEntry")
@@ -541,13 +523,7 @@ class RegisterFrame(ttk.Frame):
         # - One lowercase letter,
         # - One uppercase letter,
         # - One special character
-        if (
-            len(password) < 8
-            or not any(c.isdigit() for c in password)
-            or not any(c.islower() for c in password)
-            or not any(c.isupper() for c in password)
-            or not any(c in "!@#$%^&*()-_=+[{]}\\|;:'\",<.>/?`~" for c in password)
-        ):
+        if not _PASSWORD_RE.match(password):
             self.password_entry.configure(style="Error.TEntry")
             self.confirm_password_entry.configure(style="Error.TEntry")
             self._show_error(
@@ -561,10 +537,7 @@ class RegisterFrame(ttk.Frame):
         self.confirm_password_entry.configure(style="TEntry")
         self.register_button.config(state=tk.DISABLED)
 
-        thread = threading.Thread(
-            target=lambda: asyncio.run(self._do_register(username, name, password))
-        )
-        thread.start()
+        self.app.run_async(self._do_register(username, name, password))
 
     async def _do_register(self, username: str, name: str, password: str) -> None:
         """
@@ -576,40 +549,57 @@ class RegisterFrame(ttk.Frame):
             password (str): The password of the user.
         """
 
+        # Check if username is already taken
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                # Create user account
-                response = await client.post(
-                    f"{BASE_URL}/users/",
-                    json={
-                        "username": username,
-                        "name": name,
-                        "password": password,
-                    },
-                    timeout=5,
-                )
+            # HEAD avoids downloading the user JSON only to read the status
+            url = f"{BASE_URL}/users/{username}"
+            response = await self.app.http.head(url)
+            if response.status_code == 405:
+                # Backend without a HEAD route on this endpoint
+                response = await self.app.http.get(url)
+            if response.status_code == 200:
+                self.app.after(0, self._on_username_taken)
+                return
+
+        except Exception as e:
+            self.app.after(
+                0,
+                self._on_username_check_error,
+                f"Erreur lors de la vérification du nom d'utilisateur : {e}",
+            )
+            return
+
+        try:
+            # Create user account
+            response = await self.app.http.post(
+                f"{BASE_URL}/users/",
+                json={
+                    "username": username,
+                    "name": name,
+                    "password": password,
+                },
+                timeout=5,
+            )
 
-                if response.status_code != 200:
-                    self.app.after(
-                        0,
-                        self._on_register_error,
-                        "Erreur lors de la création du compte.",
-                    )
-                    return
-
-                # Login with new account
-                response = await client.post(
-                    f"{BASE_URL}/auth/login",
-                    params={"username": username, "password": password},
+            if response.status_code != 200:
+                self.app.after(
+                    0,
+                    self._on_register_error,
+                    "Erreur lors de la création du compte.",
                 )
+                return
+
+            # Login with new account
+            response = await self.app.http.post(
+                f"{BASE_URL}/auth/login",
+                params={"username": username, "password": password},
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    self.app.after(0, self._on_register_success, data)
-                else:
-                    self.app.after(
-                        0, self._on_register_error, "Identifiants incorrects"
-                    )
+            if response.status_code == 200:
+                data = response.json()
+                self.app.after(0, self._on_register_success, data)
+            else:
+                self.app.after(0, self._on_register_error, "Identifiants incorrects")
 
         except Exception as e:
             self.app.after(0, self._on_register_error, str(e))
@@ -640,6 +630,18 @@ class RegisterFrame(ttk.Frame):
         self.app.preferences["auth_token"] = self.app.token
         self.app.show_frame_with_loading(LobbyFrame, "Chargement du lobby...")
 
+    def _on_username_taken(self) -> None:
+        """Appelé dans le thread principal si le nom d'utilisateur est pris."""
+        self.register_button.config(state=tk.NORMAL)
+        self.username_entry.configure(style="Error.TEntry")
+        self._show_error("Le nom d'utilisateur est déjà pris.")
+
+    def _on_username_check_error(self, error: str) -> None:
+        """Appelé dans le thread principal si la vérification du nom d'utilisateur échoue."""
+        # Keep the user's input, only the request failed
+        self.register_button.config(state=tk.NORMAL)
+        self._show_error(error)
+
     def _on_register_error(self, error: str) -> None:
         """Appelé dans le thread principal après erreur."""
         self.register_button.config(state=tk.NORMAL)
@@ -655,10 +657,9 @@ class RegisterFrame(ttk.Frame):
             dialog.lift()
             dialog.focus_set()
 
-        # Reset entries and button for retry
-        self.password_var.set("")
-        self.username_var.set("")
-        self.register_button.config(state=tk.NORMAL)
+        # Reset entries for retry
+        self.password_entry.delete(0, tk.END)
+        self.username_entry.delete(0, tk.END)
 
     def _show_error(self, message: str) -> None:
         """
@@ -688,9 +689,6 @@ class RegisterFrame(ttk.Frame):
         """
         Handle return action to go back to the previous frame.
         """
-        # Clean up mousewheel binding
-        if self._mousewheel_binding:
-            self.unbind_all("<MouseWheel>")
 
         # Close dialog
         dialog = self.winfo_toplevel()
@@ -8,13 +8,23 @@ volume levels, and other application settings.
 from typing import TYPE_CHECKING
 import tkinter as tk
 import tkinter.ttk as ttk
-from tkinter import messagebox
 
-from gui.widgets import TopLevelWindow
+from gui.widgets import TopLevelWindow, preload_scaled_images
 
 if TYPE_CHECKING:
     from gui.app import App
 
+_RULES_TEXT = (
+    "Règles du jeu de Go:\n\n"
+    "1. Le jeu se joue sur une grille de 9x9, 13x13 ou 19x19 intersections.\n"
+    "2. Deux joueurs (Noir et Blanc) placent alternativement des pierres sur les intersections.\n"
+    "3. L'objectif est de contrôler le plus de territoire en encerclant des zones.\n"
+    "4. Les pierres entourées sans libertés sont capturées et retirées du plateau.\n"
+    "5. Le jeu se termine lorsque les deux joueurs passent consécutivement.\n"
+    "6. Le score est calculé en fonction du territoire contrôlé et des pierres capturées.\n\n"
+    "Pour plus de détails, consultez les règles officielles du jeu de Go."
+)
+
 
 class SettingsFrame(ttk.Frame):
     """
@@ -37,6 +47,13 @@ class SettingsFrame(ttk.Frame):
         self.app = app
         loading = self.app.show_loading("Chargement des paramètres...")
 
+        # Rules window while it is open, rebuilt on the next open once closed
+        self._rules_window: TopLevelWindow | None = None
+
+        # Pending debounced save of the settings
+        self._save_after_id: str | None = None
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
         # Title
         title = ttk.Label(self, text="Paramètres", style="Title.TLabel")
         title.pack(pady=(20, 40))
@@ -61,6 +78,11 @@ class SettingsFrame(ttk.Frame):
         option_frame.content_frame.grid_rowconfigure(2, weight=1)
         option_frame.content_frame.grid_rowconfigure(3, weight=1)
 
+        # Volume values, kept on the frame so the sliders and _save_settings share them
+        self._master_var = tk.IntVar(value=self.app.preferences["master_volume"])
+        self._music_var = tk.IntVar(value=self.app.preferences["music_volume"])
+        self._effects_var = tk.IntVar(value=self.app.preferences["effects_volume"])
+
         # Volume controls
         self.master_volume_label = self.app.Label(
             option_frame.content_frame,
@@ -75,7 +97,7 @@ class SettingsFrame(ttk.Frame):
             from_=0,
             to=100,
             orient=tk.HORIZONTAL,
-            variable=tk.IntVar(value=self.app.preferences["master_volume"]),
+            variable=self._master_var,
             takefocus=False,
         )
         self.master_volume_slider.grid(
@@ -95,7 +117,7 @@ class SettingsFrame(ttk.Frame):
             from_=0,
             to=100,
             orient=tk.HORIZONTAL,
-            variable=tk.IntVar(value=self.app.preferences["music_volume"]),
+            variable=self._music_var,
             takefocus=False,
         )
         self.music_volume_slider.grid(
@@ -115,18 +137,53 @@ class SettingsFrame(ttk.Frame):
             from_=0,
             to=100,
             orient=tk.HORIZONTAL,
-            variable=tk.IntVar(value=self.app.preferences["effects_volume"]),
+            variable=self._effects_var,
             takefocus=False,
         )
         self.effects_volume_slider.grid(
             row=2, column=1, padx=(10, 30), pady=(10, 20), sticky="ew"
         )
 
+        # Variable, label, muted icon, icon and previous value attribute of each slider
+        self._slider_info = {
+            self.master_volume_slider: (
+                self._master_var,
+                self.master_volume_label,
+                self.app.no_sound_icon_path,
+                self.app.sound_icon_path,
+                "_old_master_volume",
+            ),
+            self.music_volume_slider: (
+                self._music_var,
+                self.music_volume_label,
+                self.app.no_music_icon_path,
+                self.app.music_icon_path,
+                "_old_music_volume",
+            ),
+            self.effects_volume_slider: (
+                self._effects_var,
+                self.effects_volume_label,
+                self.app.no_effects_icon_path,
+                self.app.effects_icon_path,
+                "_old_effects_volume",
+            ),
+        }
+
         # Store previous volume values for comparison
         self._old_master_volume = self.app.preferences["master_volume"]
         self._old_music_volume = self.app.preferences["music_volume"]
         self._old_effects_volume = self.app.preferences["effects_volume"]
 
+        # Prepare the muted icons while loading, before a slider first reaches 0
+        preload_scaled_images(
+            [
+                self.app.no_sound_icon_path,
+                self.app.no_music_icon_path,
+                self.app.no_effects_icon_path,
+            ],
+            (32, 32),
+        )
+
         self.app.hide_loading(loading)
 
         # Rules button
@@ -139,20 +196,34 @@ class SettingsFrame(ttk.Frame):
             takefocus=False,
         ).pack(pady=(20, 10), padx=20)
 
-        # Return to Lobby button
-        self.app.Button(
+        # Return to Lobby button, its icon is loaded once the settings are shown
+        self.return_button = self.app.Button(
             self.container,
             text="Retour",
-            overlay_path=self.app.return_icon_path,
-            hover_overlay_path=self.app.hovered_return_icon_path,
             command=self._on_return,
             takefocus=False,
-        ).pack(pady=(20, 20), padx=20)
+        )
+        self.return_button.pack(pady=(20, 20), padx=20)
+        self.after_idle(self._load_return_icon)
+
+        # Save settings when the slider values actually change
+        for variable in (self._master_var, self._music_var, self._effects_var):
+            variable.trace_add("write", self._on_volume_write)
 
-        # Save settings when sliders or checkbox are changed
-        self.master_volume_slider.config(command=lambda e: self._save_settings())
-        self.music_volume_slider.config(command=lambda e: self._save_settings())
-        self.effects_volume_slider.config(command=lambda e: self._save_settings())
+        # Save right away when a slider is released, without waiting for the debounce
+        self.master_volume_slider.bind("<ButtonRelease-1>", self._on_slider_release)
+        self.music_volume_slider.bind("<ButtonRelease-1>", self._on_slider_release)
+        self.effects_volume_slider.bind("<ButtonRelease-1>", self._on_slider_release)
+
+    def _load_return_icon(self) -> None:
+        """
+        Draw the icons of the return button after the first paint of the settings.
+        """
+
+        if self.return_button.winfo_exists():
+            self.return_button.set_overlay(
+                self.app.return_icon_path, self.app.hovered_return_icon_path
+            )
 
     def _check_variable(self, slider: ttk.Scale) -> None:
         """
@@ -162,56 +233,108 @@ class SettingsFrame(ttk.Frame):
         Args:
             slider (ttk.Scale): The slider to check.
         """
-        value = int(float(slider.get()))
-
-        # Get old value for comparison
-        if slider == self.master_volume_slider:
-            old_value = self._old_master_volume
-            label = self.master_volume_label
-        elif slider == self.music_volume_slider:
-            old_value = self._old_music_volume
-            label = self.music_volume_label
-        else:
-            old_value = self._old_effects_volume
-            label = self.effects_volume_label
+        variable, label, muted_icon, icon, old_attr = self._slider_info[slider]
+        value = variable.get()
 
         # Only run if new or old value is 0
         if value == 0:
-            if slider == self.master_volume_slider:
-                label.set_image(self.app.no_sound_icon_path)
-            elif slider == self.music_volume_slider:
-                label.set_image(self.app.no_music_icon_path)
-            else:
-                label.set_image(self.app.no_effects_icon_path)
-        elif old_value == 0:
+            new_icon = muted_icon
+        elif getattr(self, old_attr) == 0:
             # Reset to original icon if not muted
-            if slider == self.master_volume_slider:
-                label.set_image(self.app.sound_icon_path)
-            elif slider == self.music_volume_slider:
-                label.set_image(self.app.music_icon_path)
-            else:
-                label.set_image(self.app.effects_icon_path)
+            new_icon = icon
+        else:
+            return
+
+        if label.image_path != new_icon:
+            label.set_image(new_icon)
 
     def _save_settings(self) -> None:
+        """
+        Schedule a save of the settings, coalescing the changes of a slider drag.
+        """
+
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(200, self._do_save)
+
+    def _flush_save(self, update_icons: bool = True) -> None:
+        """
+        Run the pending save of the settings right away, if any.
+
+        Args:
+            update_icons (bool): Whether to update the volume icons. Defaults to True.
+        """
+
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._do_save(update_icons)
+
+    def _on_volume_write(self, name: str, index: str, mode: str) -> None:
+        """
+        Schedule a save when one of the volume variables is written.
+
+        Args:
+            name (str): The Tcl name of the variable.
+            index (str): The index of the variable, empty for scalars.
+            mode (str): The traced operation, always "write".
+        """
+
+        self._save_settings()
+
+    def _on_slider_release(self, event: tk.Event) -> None:
+        """
+        Save the final value of a slider once it is released.
+
+        Args:
+            event (tk.Event): The button release event.
+        """
+
+        self._flush_save()
+
+    def _do_save(self, update_icons: bool = True) -> None:
         """
         Save the current settings to the application preferences.
+
+        Args:
+            update_icons (bool): Whether to update the volume icons. Defaults to True.
         """
 
+        self._save_after_id = None
+
+        master_volume = self._master_var.get()
+        music_volume = self._music_var.get()
+        effects_volume = self._effects_var.get()
+
+        # Keep only the volumes that moved since the last save
+        changed = {
+            key: value
+            for key, value, old_value in (
+                ("master_volume", master_volume, self._old_master_volume),
+                ("music_volume", music_volume, self._old_music_volume),
+                ("effects_volume", effects_volume, self._old_effects_volume),
+            )
+            if value != old_value
+        }
+        if not changed:
+            return
+
         # Save sound settings
         # self.app.preferences["sound_enabled"] = self.sound_enabled.get()
-        self.app.preferences["master_volume"] = self.master_volume_slider.get()
-        self.app.preferences["music_volume"] = self.music_volume_slider.get()
-        self.app.preferences["effects_volume"] = self.effects_volume_slider.get()
+        self.app.preferences.update(changed)
 
         # Check slider values for icon updates
-        self._check_variable(self.master_volume_slider)
-        self._check_variable(self.music_volume_slider)
-        self._check_variable(self.effects_volume_slider)
+        if update_icons:
+            if "master_volume" in changed:
+                self._check_variable(self.master_volume_slider)
+            if "music_volume" in changed:
+                self._check_variable(self.music_volume_slider)
+            if "effects_volume" in changed:
+                self._check_variable(self.effects_volume_slider)
 
         # Update old values for next comparison
-        self._old_master_volume = self.app.preferences["master_volume"]
-        self._old_music_volume = self.app.preferences["music_volume"]
-        self._old_effects_volume = self.app.preferences["effects_volume"]
+        self._old_master_volume = master_volume
+        self._old_music_volume = music_volume
+        self._old_effects_volume = effects_volume
 
         # Apply updated preferences
         self.app.apply_preferences()
@@ -221,24 +344,57 @@ class SettingsFrame(ttk.Frame):
         Open game rules window.
         """
 
-        rules_text = (
-            "Règles du jeu de Go:\n\n"
-            "1. Le jeu se joue sur une grille de 9x9, 13x13 ou 19x19 intersections.\n"
-            "2. Deux joueurs (Noir et Blanc) placent alternativement des pierres sur les intersections.\n"
-            "3. L'objectif est de contrôler le plus de territoire en encerclant des zones.\n"
-            "4. Les pierres entourées sans libertés sont capturées et retirées du plateau.\n"
-            "5. Le jeu se termine lorsque les deux joueurs passent consécutivement.\n"
-            "6. Le score est calculé en fonction du territoire contrôlé et des pierres capturées.\n\n"
-            "Pour plus de détails, consultez les règles officielles du jeu de Go."
+        if self._rules_window is not None and self._rules_window.winfo_exists():
+            self._rules_window.lift()
+            return
+
+        self._rules_window = TopLevelWindow(
+            self.app, width=700, height=420, fade_in=False, overlay=False
         )
+        ttk.Label(
+            self._rules_window.body_frame,
+            text=_RULES_TEXT,
+            wraplength=640,
+            justify=tk.LEFT,
+        ).pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
+        self.app.Button(
+            self._rules_window.button_frame,
+            text="Fermer",
+            command=self._rules_window.close,
+            takefocus=False,
+        ).pack()
+        self._rules_window.show(wait=False)
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        """
+        Save the pending settings and destroy the rules window along with the
+        settings frame.
+
+        Args:
+            event (tk.Event): The destroy event.
+        """
 
-        messagebox.showinfo("Règles du jeu", rules_text)
+        if event.widget is not self:
+            return
+
+        # The dialog may be closed without _on_return (e.g. Escape), keep the
+        # last slider change; the labels are being destroyed, skip their icons
+        self._flush_save(update_icons=False)
+
+        if self._rules_window is not None:
+            try:
+                self._rules_window.destroy()
+            except tk.TclError:
+                pass
+            self._rules_window = None
 
     def _on_return(self) -> None:
         """
         Handle return action to go back to the previous frame.
         """
 
+        self._flush_save()
+
         # Close dialog
         dialog = self.winfo_toplevel()
         if isinstance(dialog, TopLevelWindow):
@@ -7,7 +7,7 @@ on the game canvas, such as stone bowls.
 
 import tkinter as tk
 import math
-import random
+import numpy as np
 from PIL import ImageTk
 
 
@@ -27,10 +27,12 @@ class StoneBowl:
         color (int): Color identifier for the stones (0 for black, 1 for white)
         stone_image (ImageTk.PhotoImage): Image to use for individual stones
         count (int): Current number of stones remaining in the bowl
+        visible_count (int): Maximum number of stones rendered in the bowl
         bowl_back (ImageTk.PhotoImage): Image for the back/bottom of the bowl
         bowl_front (ImageTk.PhotoImage): Image for the front/rim of the bowl
         stone_items (list[int]): Canvas item IDs for rendered stones
-        stone_coordinates (list[tuple[float, float]]): Pre-calculated positions for stones
+        stone_coordinates (np.ndarray): Pre-calculated top-left (x, y) positions for stones,
+                                        one row per stone
     """
 
     def __init__(
@@ -43,6 +45,7 @@ class StoneBowl:
         bowl_back: ImageTk.PhotoImage,
         bowl_front: ImageTk.PhotoImage,
         initial_count: int,
+        total_count: int | None = None,
     ):
         """
         Initialize the stone bowl.
@@ -55,20 +58,28 @@ class StoneBowl:
             stone_image (ImageTk.PhotoImage): Image to render for each stone
             bowl_back (ImageTk.PhotoImage): Image for the bowl's back layer
             bowl_front (ImageTk.PhotoImage): Image for the bowl's front layer
-            initial_count (int): Initial number of stones in the bowl
+            initial_count (int): Number of stones rendered in the bowl
+            total_count (int, optional): Number of stones available in the bowl, the
+                rendered stones are replenished while some remain. Defaults to
+                initial_count.
         """
         self.canvas = canvas
         self.cx, self.cy = center
         self.radius = radius
         self.color = stone_color
         self.stone_image = stone_image
-        self.count = initial_count
+        self.count = total_count if total_count is not None else initial_count
+        self.visible_count = initial_count
 
         self.bowl_back = bowl_back
         self.bowl_front = bowl_front
 
         self.stone_items: list[int] = []
-        self.stone_coordinates: list[tuple[float, float]] = []
+        self.stone_coordinates: np.ndarray = np.empty((0, 2))
+        self._front_item: int | None = None
+
+        # Canvas tag shared by the stones and the rim of this bowl
+        self._tag = f"bowl_{self.color}"
 
         self._generate_coordinates()
 
@@ -81,6 +92,9 @@ class StoneBowl:
         2. Stones at randomized positions
         3. Front/rim of the bowl (for depth effect)
         """
+        # Remove the stones and rim of a previous draw
+        self.clear()
+
         # Back layer of the bowl
         self.canvas.create_image(
             self.cx, self.cy, image=self.bowl_back, anchor="center", tags=("bowls",)
@@ -90,32 +104,44 @@ class StoneBowl:
         self._draw_stones()
 
         # Front layer/rim of the bowl
-        self.canvas.create_image(
-            self.cx, self.cy, image=self.bowl_front, anchor="center"
+        self._front_item = self.canvas.create_image(
+            self.cx, self.cy, image=self.bowl_front, anchor="center", tags=(self._tag,)
         )
 
+    def clear(self) -> None:
+        """
+        Delete the rendered stones and the rim of the bowl in a single canvas call.
+        """
+        self.canvas.delete(self._tag)
+        self.stone_items.clear()
+        self._front_item = None
+
     def _generate_coordinates(self) -> None:
         """
         Generate random coordinates for stone positions within the bowl.
 
         Uses polar coordinates (angle and radius) to distribute stones
         naturally within the bowl's circular boundary, accounting for
-        stone size to prevent overflow.
+        stone size to prevent overflow. The positions are stored as the top-left
+        corner of each stone so they can be used as is with a "nw" anchor.
         """
-        # Leave space for stone size at the edges
-        max_radius = self.radius * 0.9 - self.stone_image.height() / 2
+        w = self.stone_image.width()
+        h = self.stone_image.height()
 
-        for _ in range(self.count):
-            # Random angle (0 to 2π radians)
-            angle = random.uniform(0, 2 * 3.14159)
-            # Random radius from center
-            r = random.uniform(0, max_radius)
+        # Leave space for stone size at the edges
+        max_radius = self.radius * 0.9 - h / 2
 
-            # Convert polar to Cartesian coordinates
-            x = self.cx + r * math.cos(angle)
-            y = self.cy + r * math.sin(angle)
+        # Random angles (0 to 2π radians) and radii from center, for all stones at once
+        angles = np.random.uniform(0, math.tau, self.visible_count)
+        radii = np.random.uniform(0, max_radius, self.visible_count)
 
-            self.stone_coordinates.append((x, y))
+        # Convert polar to Cartesian coordinates, shifted to the stone's corner
+        self.stone_coordinates = np.column_stack(
+            (
+                self.cx - w // 2 + radii * np.cos(angles),
+                self.cy - h // 2 + radii * np.sin(angles),
+            )
+        )
 
     def _draw_stones(self) -> None:
         """
@@ -124,18 +150,36 @@ class StoneBowl:
         Creates canvas image items for each stone and stores their IDs
         for later manipulation (e.g., removal when stone is played).
         """
-        for i in range(self.count):
-            x, y = self.stone_coordinates[i]
-            w = self.stone_image.width()
-            h = self.stone_image.height()
+        for i in range(min(self.count, self.visible_count)):
+            self.stone_items.append(self._create_stone(i))
 
-            item = self.canvas.create_image(
-                x - w // 2,
-                y - h // 2,
-                image=self.stone_image,
-                anchor="nw",
-            )
-            self.stone_items.append(item)
+    def _create_stone(self, index: int) -> int:
+        """
+        Create the canvas item of a stone at one of the pre-calculated positions.
+
+        Args:
+            index (int): The index of the position in stone_coordinates.
+
+        Returns:
+            int: The canvas item ID of the stone.
+        """
+        x, y = self.stone_coordinates[index]
+        return self.canvas.create_image(
+            x, y, image=self.stone_image, anchor="nw", tags=(self._tag,)
+        )
+
+    def _replenish(self) -> None:
+        """
+        Render a new stone in the bowl if more stones remain than are displayed.
+        """
+        if self.count <= len(self.stone_items):
+            return
+
+        item = self._create_stone(len(self.stone_items))
+        if self._front_item is not None:
+            # Keep the new stone under the rim of the bowl
+            self.canvas.tag_lower(item, self._front_item)
+        self.stone_items.append(item)
 
     def pop_stone(self) -> tuple[float, float] | None:
         """
@@ -155,10 +199,12 @@ class StoneBowl:
         item = self.stone_items.pop()
         self.count -= 1
 
-        x, y = self.canvas.coords(item)
+        # Stones are created at the position matching their index in stone_items
+        x, y = self.stone_coordinates[len(self.stone_items)]
         self.canvas.delete(item)
+        self._replenish()
 
-        return x, y
+        return float(x), float(y)
 
     def pop_stone_item(self) -> int | None:
         """
@@ -175,4 +221,8 @@ class StoneBowl:
             return None
 
         self.count -= 1
-        return self.stone_items.pop()
+        item = self.stone_items.pop()
+        # The caller now owns the item, keep it out of clear()
+        self.canvas.dtag(item, self._tag)
+        self._replenish()
+        return item
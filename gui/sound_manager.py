@@ -6,6 +6,8 @@ playing, and controlling game sound effects and music using pygame.mixer.
 """
 
 from pathlib import Path
+import queue
+import threading
 import pygame
 
 
@@ -23,6 +25,9 @@ class SoundManager:
         sounds (dict): Dictionary mapping event names to pygame.mixer.Sound objects
     """
 
+    # Maximum number of sounds waiting to be played, extra sounds are dropped
+    QUEUE_SIZE = 16
+
     def __init__(self, enabled: bool = True):
         """
         Initialize the sound manager.
@@ -34,6 +39,9 @@ class SoundManager:
         self.volume = 0.7
         self.sounds = {}
 
+        # Sounds posted from the UI thread, played by a worker thread
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=self.QUEUE_SIZE)
+
         if self.enabled:
             try:
                 pygame.mixer.init()
@@ -41,6 +49,10 @@ class SoundManager:
             except Exception as e:
                 self.enabled = False
 
+        # Without any loaded sound nothing can be posted, so no worker is needed
+        if self.sounds:
+            threading.Thread(target=self._worker, daemon=True).start()
+
     def _load_sounds(self) -> None:
         """
         Load all sound files from the sounds directory.
@@ -92,6 +104,8 @@ class SoundManager:
         """
         Play a sound effect, stopping any currently playing sounds first.
 
+        Only called by the worker thread, use post to play a sound from elsewhere.
+
         Args:
             event (str): The event name (e.g., 'stone_placed', 'pass', 'game_over')
         """
@@ -104,6 +118,30 @@ class SoundManager:
         except Exception as e:
             return
 
+    def post(self, event: str) -> None:
+        """
+        Queue a sound effect to be played exclusively by the worker thread.
+
+        Unlike play_exclusive, this never blocks the caller on the audio device.
+
+        Args:
+            event (str): The event name (e.g., 'stone_placed', 'pass', 'game_over')
+        """
+        if not self.enabled or event not in self.sounds:
+            return
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            return
+
+    def _worker(self) -> None:
+        """
+        Play the posted sound effects, in order.
+        """
+        while True:
+            self.play_exclusive(self._queue.get())
+
     def stop(self, event: str) -> None:
         """
         Stop a specific sound effect.
@@ -6,6 +6,7 @@ saving and loading preferences to/from JSON files.
 """
 
 import json
+import os
 from pathlib import Path
 
 from config import LOCAL_USERNAMES
@@ -15,6 +16,9 @@ def save_preferences(preferences: dict, filename: str | Path) -> None:
     """
     Save a dictionary of preferences to a JSON file.
 
+    The preferences are written to a temporary file first, which then replaces
+    the previous file, so a crash while saving never leaves a truncated file.
+
     Args:
         preferences (dict): Dictionary containing preference key-value pairs
         filename (str | Path): Path to the JSON file to save to
@@ -27,9 +31,11 @@ def save_preferences(preferences: dict, filename: str | Path) -> None:
         raise TypeError("Preferences must be a dictionary")
 
     filepath = Path(filename)
+    temp_path = filepath.with_name(filepath.name + ".tmp")
 
-    with open(filepath, "w", encoding="utf-8") as f:
+    with open(temp_path, "w", encoding="utf-8") as f:
         json.dump(preferences, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, filepath)
 
 
 def load_preferences(filename: str | Path) -> dict:
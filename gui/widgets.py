@@ -25,6 +25,10 @@ _IMAGE_CACHE: dict[Path, Image.Image] = {}
 _IMAGE_CACHE_LOCK = threading.Lock()
 _RESIZED_IMAGE_CACHE: dict[tuple[Path, int, int], Image.Image] = {}
 _RESIZED_IMAGE_CACHE_LOCK = threading.Lock()
+_THUMBNAIL_CACHE: dict[tuple[Path, int], Image.Image] = {}
+_THUMBNAIL_CACHE_LOCK = threading.Lock()
+_SCALED_IMAGE_CACHE: dict[tuple[Path, int, int], Image.Image] = {}
+_SCALED_IMAGE_CACHE_LOCK = threading.Lock()
 
 
 def _get_cached_image(image_path: Path) -> Image.Image:
@@ -55,6 +59,39 @@ def _get_resized_image(image_path: Path, width: int, height: int) -> Image.Image
     return cached
 
 
+def _get_thumbnail_image(image_path: Path, max_size: int) -> Image.Image | None:
+    """Get an image shrunk to fit in a max_size square from cache, None if missing."""
+    key = (image_path, max_size)
+    with _THUMBNAIL_CACHE_LOCK:
+        cached = _THUMBNAIL_CACHE.get(key)
+        if cached is None:
+            if not image_path.exists():
+                return None
+            cached = _get_cached_image(image_path).copy()
+            cached.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            _THUMBNAIL_CACHE[key] = cached
+    return cached
+
+
+def _get_scaled_image(
+    image_path: Path, size: tuple[int, int] | None
+) -> Image.Image | None:
+    """Get an image scaled to size (None = original size) from cache, None if missing."""
+    if size is None:
+        return _get_cached_image(image_path) if image_path.exists() else None
+    key = (image_path, size[0], size[1])
+    with _SCALED_IMAGE_CACHE_LOCK:
+        cached = _SCALED_IMAGE_CACHE.get(key)
+        if cached is None:
+            if not image_path.exists():
+                return None
+            cached = _get_cached_image(image_path).resize(
+                size, Image.Resampling.LANCZOS
+            )
+            _SCALED_IMAGE_CACHE[key] = cached
+    return cached
+
+
 def clear_image_cache(image_path: Path) -> None:
     """Remove cached entries for a specific image path."""
     with _IMAGE_CACHE_LOCK:
@@ -65,6 +102,12 @@ def clear_image_cache(image_path: Path) -> None:
         ]
         for key in keys_to_remove:
             _RESIZED_IMAGE_CACHE.pop(key, None)
+    with _THUMBNAIL_CACHE_LOCK:
+        for key in [key for key in _THUMBNAIL_CACHE if key[0] == image_path]:
+            _THUMBNAIL_CACHE.pop(key, None)
+    with _SCALED_IMAGE_CACHE_LOCK:
+        for key in [key for key in _SCALED_IMAGE_CACHE if key[0] == image_path]:
+            _SCALED_IMAGE_CACHE.pop(key, None)
 
 
 def preload_images_async(paths: list[Path]) -> None:
@@ -80,6 +123,47 @@ def preload_images_async(paths: list[Path]) -> None:
     threading.Thread(target=_worker, daemon=True).start()
 
 
+def preload_scaled_images(paths: list[Path], size: tuple[int, int]) -> None:
+    """Decode and scale images ahead of their first display, to avoid a stall then."""
+    for path in paths:
+        _get_scaled_image(Path(path), size)
+
+
+def bind_mousewheel_scroll(owner: tk.Misc, canvas: tk.Canvas) -> None:
+    """
+    Scroll a canvas with the mouse wheel while the pointer is over it or its children.
+
+    The wheel binding is scoped to the canvas and its children through a dedicated
+    bind tag instead of a global bind_all handler, and is removed with the owner.
+    Call it once the content of the canvas is built, later children are not tagged.
+
+    Args:
+        owner (tk.Misc): The widget owning the scrollable area.
+        canvas (tk.Canvas): The scrollable canvas.
+    """
+
+    def _on_mousewheel(event):
+        try:
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        except tk.TclError:
+            # Canvas has been destroyed, binding will be cleaned up
+            pass
+
+    def _on_destroy(event):
+        if event.widget is owner:
+            owner.unbind_class(tag, "<MouseWheel>")
+
+    def _add_tag(widget: tk.Misc) -> None:
+        widget.bindtags((tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            _add_tag(child)
+
+    tag = f"MouseWheel{id(owner)}"
+    owner.bind_class(tag, "<MouseWheel>", _on_mousewheel)
+    owner.bind("<Destroy>", _on_destroy, add="+")
+    _add_tag(canvas)
+
+
 def _get_font_path(font_name: str) -> str | None:
     """
     Try to find the full path to a font file by name.
@@ -211,17 +295,9 @@ class TransparentLabel(tk.Label):
                 except:
                     parent_w, parent_h = 800, 600  # Fallback
 
-                # Load texture and apply EXACT same logic as TexturedFrame._update_texture()
-                tex_img = Image.open(self.parent.texture_path).convert("RGBA")
-                tex_w, tex_h = tex_img.size
-                left = max(0, (tex_w - parent_w) // 2)
-                top = max(0, (tex_h - parent_h) // 2)
-                right = min(tex_w, left + parent_w)
-                bottom = min(tex_h, top + parent_h)
-
-                cropped = tex_img.crop((left, top, right, bottom))
-                scaled_texture = cropped.resize(
-                    (parent_w, parent_h), Image.Resampling.LANCZOS
+                # Get texture with the EXACT same logic as TexturedFrame._update_texture()
+                scaled_texture = _get_resized_image(
+                    Path(self.parent.texture_path), parent_w, parent_h
                 )
 
                 # Get label position relative to parent
@@ -278,13 +354,10 @@ class TransparentLabel(tk.Label):
         img_overlay = None
         img_width = 0
         img_height = 0
-        if self.image_path and self.image_path.exists():
-            img_overlay = Image.open(self.image_path).convert("RGBA")
-            # Resize image if size specified
-            if self.image_size:
-                img_overlay = img_overlay.resize(
-                    self.image_size, Image.Resampling.LANCZOS
-                )
+        if self.image_path:
+            # Decoded and resized once per path and size, icons are swapped often
+            img_overlay = _get_scaled_image(self.image_path, self.image_size)
+        if img_overlay is not None:
             img_width = img_overlay.width
             img_height = img_overlay.height
 
@@ -473,6 +546,7 @@ class TexturedButton(tk.Button):
 
         # Load and adapt texture
         self._update_texture()
+        self._preload_hover_overlay()
 
         # Bindings
         self._original_bg = self.bg
@@ -508,12 +582,10 @@ class TexturedButton(tk.Button):
         overlay = None
         overlay_width = 0
         overlay_height = 0
-        if self.overlay_path and self.overlay_path.exists():  # type: ignore
-            overlay = _get_cached_image(self.overlay_path).copy()  # type: ignore
+        if self.overlay_path:
             overlay_max_size = min(self.width, self.height) - 2 * self.overlay_padding
-            overlay.thumbnail(
-                (overlay_max_size, overlay_max_size), Image.Resampling.LANCZOS
-            )
+            overlay = _get_thumbnail_image(self.overlay_path, overlay_max_size)  # type: ignore
+        if overlay is not None:
             overlay_width = overlay.width
             overlay_height = overlay.height
 
@@ -603,10 +675,24 @@ class TexturedButton(tk.Button):
         self.height = new_height
         self._update_texture()
 
-    def set_overlay(self, overlay_path: str | Path | None):
-        """Change or remove the overlay image."""
+    def set_overlay(
+        self,
+        overlay_path: str | Path | None,
+        hover_overlay_path: str | Path | None = None,
+    ):
+        """Change or remove the overlay image, and optionally the hover one."""
         self.overlay_path = Path(overlay_path) if overlay_path else None
+        self._original_overlay_path = self.overlay_path
+        if hover_overlay_path is not None:
+            self.hover_overlay_path = Path(hover_overlay_path)
         self._update_texture()
+        self._preload_hover_overlay()
+
+    def _preload_hover_overlay(self):
+        """Shrink the hover overlay now, so the first hover does not decode it."""
+        if self.hover_overlay_path:
+            overlay_max_size = min(self.width, self.height) - 2 * self.overlay_padding
+            _get_thumbnail_image(self.hover_overlay_path, overlay_max_size)  # type: ignore
 
     def set_text(self, new_text: str):
         """Change the button text and re-render."""